@@ -2,8 +2,10 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import threading
+from typing import TYPE_CHECKING, Any
 
+import cv2
 import depthai as dai
 import numpy as np
 from loguru import logger
@@ -11,6 +13,15 @@ from loguru import logger
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
+# Reusable frame buffers per camera when the caller does not specify.
+_DEFAULT_FRAME_BUFFER_COUNT: int = 3
+# Default host-side depth of the video, inference, and depth queues. With
+# non-blocking queues a depth of 1 keeps only the newest frame: when the
+# consumer falls behind, older frames are dropped rather than processed late.
+_FRAME_QUEUE_SIZE: int = 1
+# Initial capacity of the gyro reading buffer; grown if a packet holds more.
+_GYRO_BUFFER_ROWS: int = 64
+
 
 class CameraAccess:
     """Handles OAK-D camera connection and frame access using DepthAI.
@@ -24,6 +35,24 @@ class CameraAccess:
         If True, enables the IMU node and exposes gyroscope readings.
     fps : int
         Target frames per second for each colourCamera node.
+    colour_resolution : tuple[int, int]
+        Output ``(width, height)`` requested from colour cameras.
+    mono_resolution : tuple[int, int]
+        Output ``(width, height)`` requested from mono cameras.
+    inference_resolution : tuple[int, int] | None
+        If set, colour cameras also publish a second ``(width, height)``
+        stream scaled on the device's ISP, for use as detector input via
+        ``get_inference_frame()``. None disables the extra stream.
+    frame_buffer_count : int
+        Number of reusable frame buffers kept per stream. Each frame
+        returned by ``get_frame()``, ``get_inference_frame()``, or
+        ``get_depth_frame()`` is only valid until this many further frames
+        have been read from the same stream.
+    frame_queue_size : int
+        Frames each video, inference, and depth queue holds on the host
+        before the oldest is dropped. 1 keeps only the newest frame; more
+        lets frames that arrive while the consumer is busy be read together
+        with ``get_frames()``.
     """
 
     def __init__(
@@ -32,16 +61,37 @@ class CameraAccess:
         fps: int = 30,
         colour_resolution: tuple[int, int] = (1920, 1080),
         mono_resolution: tuple[int, int] = (640, 400),
+        inference_resolution: tuple[int, int] | None = None,
+        frame_buffer_count: int = _DEFAULT_FRAME_BUFFER_COUNT,
+        frame_queue_size: int = _FRAME_QUEUE_SIZE,
     ) -> None:
         self._record_gyroscope = record_gyroscope
         self._fps = fps
         self._colour_resolution = colour_resolution
         self._mono_resolution = mono_resolution
+        self._inference_resolution = inference_resolution
+        self._frame_buffer_count = max(1, frame_buffer_count)
+        self._frame_queue_size = max(1, frame_queue_size)
         self._pipeline: dai.Pipeline | None = None
         self._video_queues: dict[str, dai.DataOutputQueue] = {}
+        self._inference_queues: dict[str, dai.DataOutputQueue] = {}
         self._imu_queue: dai.DataOutputQueue | None = None
+        # Rows of (timestamp_s, x, y, z) reused by get_gyro_data(); float64
+        # keeps microsecond timestamps exact over long sessions.
+        self._gyro_buffer: NDArray[np.float64] = np.empty(
+            (_GYRO_BUFFER_ROWS, 4), dtype=np.float64
+        )
         self._depth_queue: dai.DataOutputQueue | None = None
         self._camera_features: list[dai.CameraFeatures] = []
+        # Colour cameras stream NV12 and mono cameras GRAY8; each stream's
+        # frames (one per camera, plus the inference and depth streams) land
+        # in its own ring of preallocated buffers, allocated on first use.
+        self._nv12_cameras: set[str] = set()
+        self._frame_rings: dict[str, list[NDArray[Any]]] = {}
+        self._ring_index: dict[str, int] = {}
+        # Set from DepthAI's callback thread whenever a video or IMU packet
+        # arrives, so an idle consumer can park in wait_for_data().
+        self._data_ready = threading.Event()
 
     def start(self) -> None:
         """Discover cameras, build the DepthAI pipeline, and open the device connection.
@@ -124,6 +174,9 @@ class CameraAccess:
     ) -> tuple[list[tuple[str, object]], dai.CameraBoardSocket | None]:
         """Create one Camera node per discovered sensor and populate video queues.
 
+        Video queues hold ``frame_queue_size`` frames (by default only the
+        latest), trading dropped frames under load for minimum latency.
+
         Returns
         -------
         tuple[list[tuple[str, object]], dai.CameraBoardSocket | None]
@@ -140,10 +193,16 @@ class CameraAccess:
             is_colour = self._is_colour_sensor(cam_features)
             resolution = self._colour_resolution if is_colour else self._mono_resolution
             cam = self._pipeline.create(dai.node.Camera).build(cam_features.socket)
-            output = cam.requestOutput(resolution, fps=self._fps)
+            if is_colour:
+                output = self._request_colour_outputs(cam, cam_name, resolution)
+            else:
+                output = cam.requestOutput(
+                    resolution, type=dai.ImgFrame.Type.GRAY8, fps=self._fps
+                )
             self._video_queues[cam_name] = output.createOutputQueue(
-                maxSize=16, blocking=False
+                maxSize=self._frame_queue_size, blocking=False
             )
+            self._video_queues[cam_name].addCallback(self._on_data)
             if is_colour and colour_socket is None:
                 colour_socket = cam_features.socket
             else:
@@ -155,6 +214,48 @@ class CameraAccess:
 
         return mono_outputs, colour_socket
 
+    def _request_colour_outputs(
+        self, cam: dai.node.Camera, cam_name: str, resolution: tuple[int, int]
+    ) -> dai.Node.Output:
+        """Request a colour camera's full-size output and optional detector stream.
+
+        The full-size output is native NV12, which the host converts straight
+        into a reusable BGR buffer in ``get_frame()``. When an inference
+        resolution is configured, a second BGR output is scaled by the
+        device's ISP so the host never downsizes full frames for the detector.
+
+        Parameters
+        ----------
+        cam : dai.node.Camera
+            Camera node for the colour sensor.
+        cam_name : str
+            Socket name of the sensor (e.g. ``"CAM_A"``).
+        resolution : tuple[int, int]
+            Full-size output ``(width, height)``.
+
+        Returns
+        -------
+        dai.Node.Output
+            The full-size camera output, for linking to other nodes.
+        """
+        output = cam.requestOutput(
+            resolution, type=dai.ImgFrame.Type.NV12, fps=self._fps
+        )
+        self._nv12_cameras.add(cam_name)
+        if self._inference_resolution is not None:
+            # STRETCH keeps the full field of view, so detections map back to
+            # the full-size frame with a per-axis scale.
+            nn_output = cam.requestOutput(
+                self._inference_resolution,
+                type=dai.ImgFrame.Type.BGR888i,
+                resizeMode=dai.ImgResizeMode.STRETCH,
+                fps=self._fps,
+            )
+            self._inference_queues[cam_name] = nn_output.createOutputQueue(
+                maxSize=self._frame_queue_size, blocking=False
+            )
+        return output
+
     def _build_stereo_node(
         self,
         mono_outputs: list[tuple[str, object]],
@@ -182,7 +283,9 @@ class CameraAccess:
         stereo.setOutputSize(*self._colour_resolution)
         left_output.link(stereo.left)  # type: ignore[attr-defined]
         right_output.link(stereo.right)  # type: ignore[attr-defined]
-        self._depth_queue = stereo.depth.createOutputQueue(maxSize=8, blocking=False)
+        self._depth_queue = stereo.depth.createOutputQueue(
+            maxSize=self._frame_queue_size, blocking=False
+        )
         logger.debug(
             f"Pipeline: StereoDepth node wired ({left_name}→left, "
             f"{right_name}→right, aligned to {colour_socket.name})."
@@ -198,6 +301,33 @@ class CameraAccess:
         imu.setBatchReportThreshold(1)
         imu.setMaxBatchReports(10)
         self._imu_queue = imu.out.createOutputQueue(maxSize=50, blocking=False)
+        self._imu_queue.addCallback(self._on_data)
+
+    def _on_data(self, *_: object) -> None:
+        """Queue callback: flag that a packet is waiting to be read."""
+        self._data_ready.set()
+
+    def wait_for_data(self, timeout_s: float) -> bool:
+        """Block until a video or IMU packet arrives, or *timeout_s* elapses.
+
+        Lets a polling loop sleep between frames instead of spinning on the
+        non-blocking queues. Packets that arrived since the previous call
+        return immediately; the caller should then read every queue, as
+        the flag is cleared here.
+
+        Parameters
+        ----------
+        timeout_s : float
+            Maximum time to wait, in seconds.
+
+        Returns
+        -------
+        bool
+            True if data arrived, False on timeout.
+        """
+        ready = self._data_ready.wait(timeout_s)
+        self._data_ready.clear()
+        return ready
 
     def get_camera_names(self) -> list[str]:
         """Return the socket names of all discovered cameras.
@@ -247,6 +377,13 @@ class CameraAccess:
     def get_frame(self, cam_name: str) -> NDArray[np.uint8] | None:
         """Retrieve the most recent frame from a camera's queue.
 
+        When ``frame_queue_size`` lets several frames wait, the older ones
+        are discarded undecoded; use ``get_frames()`` to read them all.
+        Colour frames are converted from NV12, and mono frames copied, into
+        one of the camera's reusable buffers, so the returned array is
+        overwritten after ``frame_buffer_count`` further reads from the same
+        camera. Copy it if it must outlive that.
+
         Parameters
         ----------
         cam_name : str
@@ -260,16 +397,198 @@ class CameraAccess:
         queue = self._video_queues.get(cam_name)
         if queue is None:
             return None
-        if not queue.has():
+        waiting = queue.tryGetAll()
+        if not waiting:
             return None
-        msg = queue.get()
+        return self._decode_frame(cam_name, waiting[-1])
+
+    def get_frames(
+        self, cam_name: str, max_count: int
+    ) -> list[tuple[NDArray[np.uint8], float]]:
+        """Retrieve the frames waiting in a camera's queue, oldest first.
+
+        Frames are decoded into the camera's buffer ring as by
+        ``get_frame()``, so *max_count* must not exceed
+        ``frame_buffer_count`` if all of them are to stay valid. Each comes
+        with its capture time on the device clock, in seconds, the same
+        clock as the ``get_gyro_data()`` timestamps.
+
+        Parameters
+        ----------
+        cam_name : str
+            Name of the camera (e.g. ``"CAM_A"``).
+        max_count : int
+            Most frames to read; any others stay queued.
+
+        Returns
+        -------
+        list[tuple[NDArray[np.uint8], float]]
+            ``(frame, timestamp_s)`` pairs of BGR or grayscale frames in
+            arrival order; empty if none is ready.
+        """
+        queue = self._video_queues.get(cam_name)
+        frames: list[tuple[NDArray[np.uint8], float]] = []
+        if queue is None:
+            return frames
+        while len(frames) < max_count and queue.has():
+            msg = queue.get()
+            frames.append(
+                (self._decode_frame(cam_name, msg), msg.getTimestamp().total_seconds())
+            )
+        return frames
 
-        return msg.getCvFrame()  # type: ignore[no-any-return]
+    def _decode_frame(self, cam_name: str, msg: dai.ImgFrame) -> NDArray[np.uint8]:
+        """Convert a camera's video packet into the next buffer of its ring."""
+        if cam_name in self._nv12_cameras:
+            return self._convert_nv12(cam_name, msg)
+        return self._copy_packed(cam_name, msg)
+
+    def _copy_packed(
+        self,
+        ring_name: str,
+        msg: dai.ImgFrame,
+        channels: int = 1,
+        dtype: type[np.generic] = np.uint8,
+    ) -> NDArray[Any]:
+        """Copy a single-plane frame into the next buffer of a stream's ring.
+
+        ``getCvFrame()`` would allocate a new array per frame; instead the
+        packet data is viewed in place, row stride and all, and copied once
+        into the ring.
+
+        Parameters
+        ----------
+        ring_name : str
+            Name of the stream's buffer ring (see ``_next_frame_buffer()``).
+        msg : dai.ImgFrame
+            Packed frame (e.g. GRAY8, BGR888i, or RAW16 depth).
+        channels : int
+            Interleaved channels per pixel.
+        dtype : type[np.generic]
+            Pixel element type.
+
+        Returns
+        -------
+        NDArray[Any]
+            Frame of shape ``(height, width)``, or ``(height, width,
+            channels)`` for more than one channel.
+        """
+        width, height = msg.getWidth(), msg.getHeight()
+        stride = msg.getStride()
+        row_bytes = width * channels * np.dtype(dtype).itemsize
+        data: NDArray[np.uint8] = msg.getData()
+        if stride < row_bytes or data.size < stride * height:
+            return msg.getCvFrame()  # type: ignore[no-any-return]
+        shape = (height, width) if channels == 1 else (height, width, channels)
+        buffer = self._next_frame_buffer(ring_name, shape, dtype)
+        np.copyto(
+            buffer.view(np.uint8).reshape(height, row_bytes),
+            data[: stride * height].reshape(height, stride)[:, :row_bytes],
+        )
+        return buffer
+
+    def _convert_nv12(self, cam_name: str, msg: dai.ImgFrame) -> NDArray[np.uint8]:
+        """Convert an NV12 frame into the camera's next reusable BGR buffer.
+
+        The Y and interleaved UV planes are read as views over the packet
+        data and converted in one ``cvtColorTwoPlane`` call, so no
+        intermediate array is allocated.
+
+        Parameters
+        ----------
+        cam_name : str
+            Name of the colour camera the frame came from.
+        msg : dai.ImgFrame
+            NV12 frame from the camera's output queue.
+
+        Returns
+        -------
+        NDArray[np.uint8]
+            BGR frame of shape ``(height, width, 3)``.
+        """
+        width, height = msg.getWidth(), msg.getHeight()
+        stride = msg.getStride()
+        data: NDArray[np.uint8] = msg.getData()
+        y_size = stride * height
+        uv_size = stride * (height // 2)
+        if stride < width or data.size != y_size + uv_size:
+            # Planes padded below the image (e.g. 1088 rows for 1080) put the
+            # UV plane past y_size; let DepthAI convert any such layout.
+            return msg.getCvFrame()  # type: ignore[no-any-return]
+
+        y_plane = data[:y_size].reshape(height, stride)[:, :width]
+        uv_plane = (
+            data[y_size : y_size + uv_size]
+            .reshape(height // 2, stride)[:, :width]
+            .reshape(height // 2, width // 2, 2)
+        )
+        buffer = self._next_frame_buffer(cam_name, (height, width, 3))
+        cv2.cvtColorTwoPlane(y_plane, uv_plane, cv2.COLOR_YUV2BGR_NV12, dst=buffer)
+        return buffer
+
+    def _next_frame_buffer(
+        self,
+        ring_name: str,
+        shape: tuple[int, ...],
+        dtype: type[np.generic] = np.uint8,
+    ) -> NDArray[Any]:
+        """Return the next buffer in a stream's ring, allocating the ring on first use.
+
+        Parameters
+        ----------
+        ring_name : str
+            Name of the ring: the camera name for its video stream,
+            ``"<camera>/inference"`` for its inference stream, or ``"depth"``.
+        shape : tuple[int, ...]
+            Required ``(height, width[, channels])`` of the buffer.
+        dtype : type[np.generic]
+            Required element type of the buffer.
+
+        Returns
+        -------
+        NDArray[Any]
+            Preallocated buffer to write the next frame into.
+        """
+        ring = self._frame_rings.get(ring_name)
+        if ring is None or ring[0].shape != shape or ring[0].dtype != dtype:
+            ring = [
+                np.empty(shape, dtype=dtype) for _ in range(self._frame_buffer_count)
+            ]
+            self._frame_rings[ring_name] = ring
+            self._ring_index[ring_name] = 0
+        index = self._ring_index[ring_name]
+        self._ring_index[ring_name] = (index + 1) % len(ring)
+        return ring[index]
+
+    def get_inference_frame(self, cam_name: str) -> NDArray[np.uint8] | None:
+        """Return the next device-scaled detector frame for a colour camera.
+
+        Frames are returned oldest first, one per call, so that each pairs
+        with the colour frame read alongside it by ``get_frames()``. The
+        frame is copied into a reusable buffer; see ``get_frame()``.
+
+        Parameters
+        ----------
+        cam_name : str
+            Name of the colour camera (e.g. ``"CAM_A"``).
+
+        Returns
+        -------
+        NDArray[np.uint8] | None
+            BGR frame at the configured inference resolution, or None if no
+            inference stream exists for this camera or no frame is ready.
+        """
+        queue = self._inference_queues.get(cam_name)
+        if queue is None or not queue.has():
+            return None
+        return self._copy_packed(f"{cam_name}/inference", queue.get(), channels=3)
 
     def get_depth_frame(self) -> NDArray[np.uint16] | None:
-        """Return the most recent stereo depth frame, or None if not ready.
+        """Return the next stereo depth frame, or None if not ready.
 
+        Frames are returned oldest first, as by ``get_inference_frame()``.
         Depth pixel values are distances in millimetres encoded as uint16.
+        The frame is copied into a reusable buffer; see ``get_frame()``.
         Returns None if the StereoDepth node was not wired (e.g. only one
         mono camera present) or if no frame is available yet.
 
@@ -280,34 +599,40 @@ class CameraAccess:
         """
         if self._depth_queue is None or not self._depth_queue.has():
             return None
-        return self._depth_queue.get().getCvFrame()  # type: ignore[no-any-return]
+        return self._copy_packed("depth", self._depth_queue.get(), dtype=np.uint16)
 
-    def get_gyro_data(self) -> list[dict[str, float]] | None:
-        """Return parsed gyroscope readings from the latest IMU packet.
+    def get_gyro_data(self) -> NDArray[np.float64] | None:
+        """Return gyroscope readings from the latest IMU packet.
+
+        Readings are written into a preallocated buffer, so the returned
+        array is only valid until the next call.
 
         Returns
         -------
-        list[dict[str, float]] | None
-            List of readings with keys ``timestamp_s``, ``x``, ``y``, ``z``,
-            or None if no packet is available or gyroscope is not enabled.
+        NDArray[np.float64] | None
+            ``(n, 4)`` array of ``timestamp_s, x, y, z`` rows, or None if no
+            packet is available or gyroscope is not enabled.
         """
         if self._imu_queue is None:
             return None
         packet = self._imu_queue.tryGet()
         if packet is None:
             return None
-        readings = []
-        for imu_packet in packet.packets:
+        imu_packets = packet.packets
+        if not imu_packets:
+            return None
+        if len(imu_packets) > len(self._gyro_buffer):
+            self._gyro_buffer = np.empty((len(imu_packets), 4), dtype=np.float64)
+        buffer = self._gyro_buffer
+        for row, imu_packet in enumerate(imu_packets):
             gyro = imu_packet.gyroscope
-            readings.append(
-                {
-                    "timestamp_s": gyro.getTimestamp().total_seconds(),
-                    "x": gyro.x,
-                    "y": gyro.y,
-                    "z": gyro.z,
-                }
+            buffer[row] = (
+                gyro.getTimestamp().total_seconds(),
+                gyro.x,
+                gyro.y,
+                gyro.z,
             )
-        return readings or None
+        return buffer[: len(imu_packets)]
 
     def stop(self) -> None:
         """Stop the pipeline and release resources."""
@@ -318,6 +643,10 @@ class CameraAccess:
 
         # Clear all instance state to prevent use-after-stop
         self._video_queues.clear()
+        self._inference_queues.clear()
+        self._nv12_cameras.clear()
+        self._frame_rings.clear()
+        self._ring_index.clear()
         self._imu_queue = None
         self._depth_queue = None
         self._camera_features.clear()
@@ -1,22 +1,99 @@
-"""Video recording to disk with timestamped filenames."""
+"""Video recording to disk with timestamped filenames.
+
+Both recorders hand data to a dedicated writer thread through a bounded
+queue, so callers never block on encoding or filesystem latency.
+"""
 
 from __future__ import annotations
 
-import json
+import contextlib
+import queue
+import re
+import threading
+from collections.abc import Callable, Collection
 from pathlib import Path
-from typing import IO, TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, BinaryIO
 
 import cv2
 import numpy as np
+import orjson
 from loguru import logger
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
 
+    from ..depth_perception.target_estimator import DetectionEstimate
+
+# GStreamer H.264 hardware encoders as (element, pipeline fragment fed by
+# videoconvert), tried in order: Jetson V4L2 NVENC (which needs frames in
+# NVMM memory), desktop Nvidia NVENC, Intel Quick Sync, VA-API (Intel/AMD),
+# then the Raspberry Pi's V4L2 M2M encoder. Software mp4v is the fallback.
+_HW_ENCODERS: tuple[tuple[str, str], ...] = (
+    (
+        "nvv4l2h264enc",
+        "video/x-raw,format=I420 ! nvvidconv ! "
+        "video/x-raw(memory:NVMM),format=NV12 ! nvv4l2h264enc",
+    ),
+    ("nvh264enc", "nvh264enc"),
+    ("qsvh264enc", "qsvh264enc"),
+    ("vaapih264enc", "vaapih264enc"),
+    (
+        "v4l2h264enc",
+        "video/x-raw,format=I420 ! v4l2h264enc ! video/x-h264,level=(string)4",
+    ),
+)
+# Frames a video writer thread may have queued when the caller does not say.
+_DEFAULT_FRAME_QUEUE_SIZE: int = 1
+# Pending JSONL write() calls, and how many are serialised per disk write.
+_JSONL_QUEUE_SIZE: int = 1024
+_JSONL_WRITE_BATCH: int = 64
+# How long stop() waits at a time for room to queue the stop sentinel,
+# rechecking in between that the writer thread is still alive.
+_STOP_POLL_S: float = 0.1
+
+
+def _gstreamer_available() -> bool:
+    """Return True if this OpenCV build includes the GStreamer video backend."""
+    match = re.search(r"GStreamer:\s*(\w+)", cv2.getBuildInformation())
+    return match is not None and match.group(1) == "YES"
+
+
+_GSTREAMER_AVAILABLE: bool = _gstreamer_available()
+
+
+def _stop_writer(thread: threading.Thread, pending: queue.Queue[Any]) -> None:
+    """Send a writer thread the stop sentinel and wait for it to finish.
+
+    A writer that has died (after logging its error) with a full queue
+    would never make room for the sentinel, so the put is retried only
+    while the thread is still alive.
+
+    Parameters
+    ----------
+    thread : threading.Thread
+        The writer thread.
+    pending : queue.Queue[Any]
+        The queue it drains; None is its stop sentinel.
+    """
+    while thread.is_alive():
+        try:
+            pending.put(None, timeout=_STOP_POLL_S)
+        except queue.Full:
+            continue
+        break
+    thread.join()
+
 
 class CameraRecording:
     """Handles video recording with timestamps and saves to disk.
 
+    Frames passed to ``write()`` are copied into a pool of buffers owned by
+    the recorder (one per queue slot, plus the one being encoded) and
+    encoded on a writer thread, which returns each buffer to the pool once
+    it is written. Callers may therefore reuse a frame as soon as
+    ``write()`` returns. If the writer falls behind and every buffer is in
+    use, new frames are dropped; the number dropped is logged on ``stop()``.
+
     Parameters
     ----------
     output_dir : Path
@@ -24,13 +101,33 @@ class CameraRecording:
         does not exist.
     file_prefix : str
         Filename prefix. A timestamp and extension are appended automatically.
+    queue_size : int
+        Frames that may wait for the writer thread before new ones are
+        dropped.
     """
 
-    def __init__(self, output_dir: Path, file_prefix: str = "recording") -> None:
+    def __init__(
+        self,
+        output_dir: Path,
+        file_prefix: str = "recording",
+        queue_size: int = _DEFAULT_FRAME_QUEUE_SIZE,
+    ) -> None:
         self._output_dir = output_dir
         self._file_prefix = file_prefix
         self._writer: cv2.VideoWriter | None = None
         self._timestamp: str = ""
+        self._queue_size = queue_size
+        # None is the stop sentinel for the writer thread. The buffer pool
+        # bounds how many frames can be queued.
+        self._queue: queue.Queue[NDArray[np.uint8] | None] = queue.Queue()
+        # Free buffers, filled in start(); None marks one not yet allocated.
+        self._free_buffers: queue.SimpleQueue[NDArray[np.uint8] | None] = (
+            queue.SimpleQueue()
+        )
+        self._thread: threading.Thread | None = None
+        # Frames refused by a full queue this recording (write() is only
+        # called from one thread).
+        self._frames_dropped: int = 0
 
     @property
     def timestamp(self) -> str:
@@ -65,41 +162,153 @@ class CameraRecording:
         """
         self._output_dir.mkdir(parents=True, exist_ok=True)
         self._timestamp = timestamp
+        self._frames_dropped = 0
+        self._free_buffers = queue.SimpleQueue()
+        for _ in range(self._queue_size + 1):
+            self._free_buffers.put(None)
         filename = f"{self._file_prefix}_{self._timestamp}.mp4"
         output_path = self._output_dir / filename
-        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
-        self._writer = cv2.VideoWriter(
-            str(output_path), fourcc, fps, (frame_width, frame_height), is_colour
+        self._writer = self._open_writer(
+            output_path, fps, (frame_width, frame_height), is_colour
         )
         if not self._writer.isOpened():
             logger.error(f"Failed to open VideoWriter at {output_path}")
             raise RuntimeError(f"Could not open video file for writing: {output_path}")
+        # The writer stays open until stop(), so its bound write method is
+        # handed to the thread once rather than re-checked per frame.
+        self._thread = threading.Thread(
+            target=self._drain,
+            args=(self._writer.write,),
+            name=f"{self._file_prefix}-writer",
+            daemon=True,
+        )
+        self._thread.start()
         logger.info(f"Recording started: {output_path}")
 
-    def write(self, frame: NDArray[np.uint8]) -> None:
-        """Write a single frame to the video file.
+    def _open_writer(
+        self,
+        output_path: Path,
+        fps: int,
+        frame_size: tuple[int, int],
+        is_colour: bool,
+    ) -> cv2.VideoWriter:
+        """Open a VideoWriter, preferring a GStreamer hardware H.264 encoder.
+
+        Each encoder in ``_HW_ENCODERS`` is tried in turn; a pipeline fails to
+        open if its element is not installed. Falls back to OpenCV's software
+        mp4v encoder when GStreamer is unavailable or no encoder opens.
+
+        Parameters
+        ----------
+        output_path : Path
+            Destination .mp4 file.
+        fps : int
+            Frames per second for the output video.
+        frame_size : tuple[int, int]
+            ``(width, height)`` of the frames in pixels.
+        is_colour : bool
+            Whether frames are 3-channel BGR (True) or grayscale (False).
+
+        Returns
+        -------
+        cv2.VideoWriter
+            The opened writer, or an unopened mp4v writer on failure.
+        """
+        if _GSTREAMER_AVAILABLE:
+            for encoder, stage in _HW_ENCODERS:
+                gst_pipeline = (
+                    f"appsrc ! videoconvert ! {stage} ! h264parse ! mp4mux ! "
+                    # Quoted so paths containing spaces parse as one value.
+                    f'filesink location="{output_path}"'
+                )
+                writer = cv2.VideoWriter(
+                    gst_pipeline, cv2.CAP_GSTREAMER, 0, fps, frame_size, is_colour
+                )
+                if writer.isOpened():
+                    logger.info(f"Recording with hardware encoder '{encoder}'.")
+                    return writer
+                writer.release()
+            logger.debug("No GStreamer hardware encoder available; using mp4v.")
+        fourcc = cv2.VideoWriter_fourcc(*"mp4v")
+        return cv2.VideoWriter(str(output_path), fourcc, fps, frame_size, is_colour)
+
+    def write(self, frame: NDArray[np.uint8]) -> bool:
+        """Queue a copy of a single frame to be written to the video file.
+
+        Returns after copying the frame into a free pool buffer, so the
+        caller may reuse *frame* at once.
 
         Parameters
         ----------
         frame : NDArray[np.uint8]
             BGR frame array to write.
+
+        Returns
+        -------
+        bool
+            True if the frame was queued, False if it was dropped (writer
+            backlogged, or not running: not started, or stopped by an error
+            it has already logged). Only backlog drops are counted.
         """
-        if self._writer is not None and self._writer.isOpened():
-            self._writer.write(frame)
+        if self._thread is None or not self._thread.is_alive():
+            return False
+        try:
+            buffer = self._free_buffers.get_nowait()
+        except queue.Empty:
+            self._frames_dropped += 1
+            return False
+        if buffer is None or buffer.shape != frame.shape:
+            buffer = np.empty_like(frame)
+        np.copyto(buffer, frame)
+        self._queue.put_nowait(buffer)
+        return True
+
+    def _drain(self, write_frame: Callable[[NDArray[np.uint8]], None]) -> None:
+        """Writer thread: encode queued frames until the stop sentinel arrives.
+
+        Each buffer goes back to the pool once its frame is written.
+
+        Parameters
+        ----------
+        write_frame : Callable[[NDArray[np.uint8]], None]
+            The open VideoWriter's ``write`` method.
+        """
+        get = self._queue.get
+        release = self._free_buffers.put
+        try:
+            while (frame := get()) is not None:
+                write_frame(frame)
+                release(frame)
+        except Exception:
+            logger.exception(
+                f"{self._file_prefix}: video writer failed; no further frames "
+                "will be recorded."
+            )
 
     def stop(self) -> None:
-        """Release the VideoWriter and flush the file to disk."""
+        """Write any queued frames, then release the VideoWriter."""
+        if self._thread is not None:
+            _stop_writer(self._thread, self._queue)
+            self._thread = None
         if self._writer is not None:
             self._writer.release()
             self._writer = None
+            if self._frames_dropped:
+                logger.warning(
+                    f"{self._file_prefix}: writer fell behind; dropped "
+                    f"{self._frames_dropped} frame(s)."
+                )
             logger.info("Recording stopped.")
 
 
-class GyroRecorder:
-    """Records gyroscope readings to a JSONL file on disk.
+class _JsonlRecorder:
+    """Appends JSON records to a ``.jsonl`` file from a writer thread.
 
-    Each line in the output file is a JSON object with keys
-    ``timestamp_s``, ``x``, ``y``, and ``z``.
+    Subclasses expose a typed ``write()`` that hands a collection of records
+    to ``_enqueue()``, and may override ``_encode()`` to map each record to
+    a JSON line, or ``_encode_all()`` to encode a whole collection. Records
+    are encoded and written on the writer thread, several ``_enqueue()``
+    calls per disk write.
 
     Parameters
     ----------
@@ -110,10 +319,18 @@ class GyroRecorder:
         Filename prefix. A timestamp and extension are appended automatically.
     """
 
+    # Used in log messages and the writer thread's name.
+    _LABEL: str = "JSONL"
+
     def __init__(self, output_dir: Path, file_prefix: str = "recording") -> None:
         self._output_dir = output_dir
         self._file_prefix = file_prefix
-        self._file: IO[str] | None = None
+        self._file: BinaryIO | None = None
+        # None is the stop sentinel for the writer thread.
+        self._queue: queue.Queue[Collection[object] | None] = queue.Queue(
+            maxsize=_JSONL_QUEUE_SIZE
+        )
+        self._thread: threading.Thread | None = None
 
     def start(self, timestamp: str) -> None:
         """Open the JSONL file for writing.
@@ -126,25 +343,163 @@ class GyroRecorder:
         """
         self._output_dir.mkdir(parents=True, exist_ok=True)
         path = self._output_dir / f"{self._file_prefix}_{timestamp}.jsonl"
-        self._file = path.open("w", encoding="utf-8")
-        logger.info(f"Gyroscope recording started: {path}")
+        self._file = path.open("wb")
+        self._thread = threading.Thread(
+            target=self._drain,
+            name=f"{self._LABEL.lower()}-writer",
+            daemon=True,
+        )
+        self._thread.start()
+        logger.info(f"{self._LABEL} recording started: {path}")
 
-    def write(self, readings: list[dict[str, float]]) -> None:
-        """Append gyroscope readings to the JSONL file.
+    def _enqueue(self, records: Collection[object]) -> None:
+        """Queue *records* for the writer thread without blocking.
 
-        Parameters
-        ----------
-        readings : list[dict[str, float]]
-            Parsed gyroscope readings as returned by
-            ``CameraAccess.get_gyro_data()``.
+        The sequence and its records must not be modified afterwards.
+        Records are discarded if the writer is not running (not started,
+        or stopped by an error it has already logged).
         """
-        if self._file is not None:
-            for reading in readings:
-                self._file.write(json.dumps(reading) + "\n")
+        if self._thread is None or not self._thread.is_alive():
+            return
+        try:
+            self._queue.put_nowait(records)
+        except queue.Full:
+            logger.warning(
+                f"{self._LABEL} writer backlogged; dropped {len(records)} record(s)."
+            )
+
+    def _drain(self) -> None:
+        """Writer thread: append queued records until the stop sentinel arrives."""
+        try:
+            self._drain_records()
+        except Exception:
+            logger.exception(
+                f"{self._LABEL} writer failed; no further records will be written."
+            )
+
+    def _drain_records(self) -> None:
+        """Encode and write queued records; the body of ``_drain()``."""
+        stopping = False
+        while not stopping:
+            batch = [self._queue.get()]
+            # Take whatever else is already waiting, up to one write's worth.
+            with contextlib.suppress(queue.Empty):
+                while len(batch) < _JSONL_WRITE_BATCH:
+                    batch.append(self._queue.get_nowait())
+            lines: list[bytes] = []
+            for records in batch:
+                if records is None:
+                    stopping = True
+                    break
+                lines.extend(self._encode_all(records))
+            if lines and self._file is not None:
+                self._file.write(b"".join(lines))
+
+    def _encode(self, record: object) -> bytes:
+        """Serialise one record as a JSON line (without the newline)."""
+        return orjson.dumps(record)
+
+    def _encode_all(self, records: Collection[object]) -> list[bytes]:
+        """Serialise one ``_enqueue()`` call's records as newline-terminated lines."""
+        return [self._encode(record) + b"\n" for record in records]
 
     def stop(self) -> None:
-        """Close and flush the JSONL file."""
+        """Write any queued records, then close and flush the JSONL file."""
+        if self._thread is not None:
+            _stop_writer(self._thread, self._queue)
+            self._thread = None
         if self._file is not None:
             self._file.close()
             self._file = None
-            logger.info("Gyroscope recording stopped.")
+            logger.info(f"{self._LABEL} recording stopped.")
+
+
+class GyroRecorder(_JsonlRecorder):
+    """Records gyroscope readings to a JSONL file on disk.
+
+    Each line in the output file is a JSON object with keys
+    ``timestamp_s``, ``x``, ``y``, and ``z``.
+
+    Parameters
+    ----------
+    output_dir : Path
+        Directory where the JSONL file will be saved. Created if it
+        does not exist.
+    file_prefix : str
+        Filename prefix. A timestamp and extension are appended automatically.
+    """
+
+    _LABEL = "Gyroscope"
+
+    def write(self, readings: NDArray[np.float64]) -> None:
+        """Queue gyroscope readings to be appended to the JSONL file.
+
+        *readings* is copied, so the caller may reuse its buffer at once.
+
+        Parameters
+        ----------
+        readings : NDArray[np.float64]
+            ``(n, 4)`` array of ``timestamp_s, x, y, z`` rows as returned
+            by ``CameraAccess.get_gyro_data()``.
+        """
+        self._enqueue(readings.copy())
+
+    def _encode_all(self, records: Collection[object]) -> list[bytes]:
+        """Serialise an ``(n, 4)`` readings array with named keys.
+
+        The array is converted to Python floats in one ``tolist()`` call
+        rather than one row view and conversion per reading.
+        """
+        rows: list[list[float]] = np.asarray(records).tolist()
+        return [
+            orjson.dumps({"timestamp_s": timestamp_s, "x": x, "y": y, "z": z}) + b"\n"
+            for timestamp_s, x, y, z in rows
+        ]
+
+
+class DetectionRecorder(_JsonlRecorder):
+    """Records per-frame detections to a JSONL file alongside a video.
+
+    Used in place of drawing detections into the recorded video. Each line
+    is a JSON object with keys ``frame_index`` (position of the frame in
+    the camera's output stream), ``timestamp_s`` (capture time of the frame
+    on the device clock, as used for gyroscope readings), and
+    ``detections`` (list of ``DetectionEstimate`` dicts).
+
+    Parameters
+    ----------
+    output_dir : Path
+        Directory where the JSONL file will be saved. Created if it
+        does not exist.
+    file_prefix : str
+        Filename prefix. A timestamp and extension are appended automatically.
+    """
+
+    _LABEL = "Detection"
+
+    def write(
+        self,
+        frame_index: int,
+        timestamp_s: float,
+        estimates: list[DetectionEstimate],
+    ) -> None:
+        """Queue one frame's detections to be appended to the JSONL file.
+
+        Parameters
+        ----------
+        frame_index : int
+            Index of the frame in the camera's output stream.
+        timestamp_s : float
+            Capture time of the frame on the device clock, in seconds.
+        estimates : list[DetectionEstimate]
+            Detections for the frame from ``TargetEstimator.estimate()``.
+        """
+        self._enqueue(
+            [
+                {
+                    "frame_index": frame_index,
+                    "timestamp_s": timestamp_s,
+                    "detections": estimates,
+                }
+            ]
+        )
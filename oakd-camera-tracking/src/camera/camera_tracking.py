@@ -6,47 +6,82 @@ from typing import TYPE_CHECKING
 
 import cv2
 import numpy as np
+from ultralytics.utils.plotting import colors
+
+from ..inference.detections import CLS, CONF, NO_TRACK_ID, TRACK_ID
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
-    from ultralytics.engine.results import Results
 
     from ..depth_perception.target_estimator import DetectionEstimate
 
+# Annotated frames kept alive when the caller does not specify.
+_DEFAULT_BUFFER_COUNT: int = 3
+# Box line width as a fraction of the mean frame dimension, as Ultralytics.
+_LINE_WIDTH_SCALE: float = 0.003
+_MIN_LINE_WIDTH: int = 2
+
 
 class CameraTracking:
     """Applies inference results and draws bounding boxes on camera frames.
 
-    This class is stateless. A single instance can be reused across frames.
+    Annotations are drawn into a ring of preallocated buffers (one ring per
+    camera and frame shape) rather than a new array per frame. A buffer is
+    reused ``buffer_count`` calls later for the same camera, so callers must
+    be finished with an annotated frame before then. A single instance can
+    be reused across frames and cameras.
+
+    Parameters
+    ----------
+    buffer_count : int
+        Number of annotated frames per camera that may be in use at once.
     """
 
+    def __init__(self, buffer_count: int = _DEFAULT_BUFFER_COUNT) -> None:
+        self._buffer_count = buffer_count
+        # Keyed on (camera name, frame shape).
+        self._buffer_rings: dict[
+            tuple[str, tuple[int, ...]], list[NDArray[np.uint8]]
+        ] = {}
+        self._ring_index: dict[tuple[str, tuple[int, ...]], int] = {}
+
     def draw_detections(
         self,
-        _frame: NDArray[np.uint8],
-        results: Results,
+        frame: NDArray[np.uint8],
+        detections: NDArray[np.float32],
+        names: dict[int, str],
         estimates: list[DetectionEstimate] | None = None,
+        cam_name: str = "",
     ) -> NDArray[np.uint8]:
-        """Draw bounding boxes and depth labels from YOLO results onto a frame.
+        """Draw bounding boxes and depth labels from YOLO detections onto a frame.
 
         Parameters
         ----------
-        _frame : NDArray[np.uint8]
-            Original BGR frame, accepted for API compatibility but not used
-            to generate the annotated output (which comes from results.plot()).
-        results : Results
-            YOLO Results object returned by model.track() or model.predict().
+        frame : NDArray[np.uint8]
+            Original BGR frame. It is copied, not modified.
+        detections : NDArray[np.float32]
+            ``(N, 7)`` detections for the frame from ``detection_array()``.
+        names : dict[int, str]
+            Class names by class ID, as ``Results.names``.
         estimates : list[DetectionEstimate] | None
             Per-detection depth estimates from ``TargetEstimator.estimate()``.
             Each dict must contain ``distance_m`` (float or None) and
             ``bbox_xyxy`` ([x1, y1, x2, y2]). If None or empty, only YOLO
             annotations are drawn.
+        cam_name : str
+            Camera the frame came from. Each camera draws into its own
+            buffer ring, so one camera's frames cannot recycle buffers still
+            in use for another's.
 
         Returns
         -------
         NDArray[np.uint8]
             Annotated BGR frame with boxes, track IDs, and depth labels drawn.
+            This is a reused buffer; see the class docstring.
         """
-        annotated: NDArray[np.uint8] = results.plot()
+        annotated = self._next_buffer(cam_name, frame.shape)
+        np.copyto(annotated, frame)
+        self._draw_boxes(annotated, detections, names)
 
         if estimates:
             for est in estimates:
@@ -78,3 +113,83 @@ class CameraTracking:
                 )
 
         return annotated
+
+    @staticmethod
+    def _draw_boxes(
+        image: NDArray[np.uint8],
+        detections: NDArray[np.float32],
+        names: dict[int, str],
+    ) -> None:
+        """Draw YOLO boxes and labels onto *image* in place.
+
+        Box borders are written straight into the frame as array slices;
+        OpenCV is only used for the label text. Style follows
+        ``Results.plot()``: class colours, line width scaled to the frame,
+        and ``id:<track> <class> <conf>`` labels.
+        """
+        if len(detections) == 0:
+            return
+        height, width = image.shape[:2]
+        line = max(round((height + width) / 2 * _LINE_WIDTH_SCALE), _MIN_LINE_WIDTH)
+        font_scale = line / 3
+        thickness = max(line - 1, 1)
+
+        xyxy = detections[:, :4].round().astype(np.int32)
+        xyxy[:, [0, 2]] = np.clip(xyxy[:, [0, 2]], 0, width - 1)
+        xyxy[:, [1, 3]] = np.clip(xyxy[:, [1, 3]], 0, height - 1)
+        classes = detections[:, CLS].astype(np.int32).tolist()
+        confs = detections[:, CONF].tolist()
+        track_ids = detections[:, TRACK_ID].astype(np.int32).tolist()
+
+        for i, (x1, y1, x2, y2) in enumerate(xyxy.tolist()):
+            colour = colors(classes[i], True)
+            image[y1 : y1 + line, x1 : x2 + 1] = colour
+            image[max(y2 - line + 1, 0) : y2 + 1, x1 : x2 + 1] = colour
+            image[y1 : y2 + 1, x1 : x1 + line] = colour
+            image[y1 : y2 + 1, max(x2 - line + 1, 0) : x2 + 1] = colour
+
+            label = f"{names[classes[i]]} {confs[i]:.2f}"
+            if track_ids[i] != NO_TRACK_ID:
+                label = f"id:{track_ids[i]} {label}"
+            (text_w, text_h), baseline = cv2.getTextSize(
+                label, cv2.FONT_HERSHEY_SIMPLEX, font_scale, thickness
+            )
+            label_h = text_h + baseline + line
+            # Label sits above the box, or just inside it at the top edge.
+            top = y1 - label_h if y1 >= label_h else y1
+            image[top : top + label_h, x1 : x1 + text_w] = colour
+            cv2.putText(
+                image,
+                label,
+                (x1, top + text_h + line // 2),
+                cv2.FONT_HERSHEY_SIMPLEX,
+                font_scale,
+                (255, 255, 255),
+                thickness,
+                cv2.LINE_AA,
+            )
+
+    def _next_buffer(self, cam_name: str, shape: tuple[int, ...]) -> NDArray[np.uint8]:
+        """Return the next annotation buffer for *cam_name*'s frames of *shape*.
+
+        Parameters
+        ----------
+        cam_name : str
+            Camera the frame came from.
+        shape : tuple[int, ...]
+            Shape of the frame to be annotated.
+
+        Returns
+        -------
+        NDArray[np.uint8]
+            Preallocated buffer to draw the next annotated frame into.
+        """
+        key = (cam_name, shape)
+        ring = self._buffer_rings.get(key)
+        if ring is None:
+            ring = [np.empty(shape, dtype=np.uint8) for _ in range(self._buffer_count)]
+            self._buffer_rings[key] = ring
+            self._ring_index[key] = 0
+        index = self._ring_index[key]
+        self._ring_index[key] = (index + 1) % len(ring)
+        return ring[index]
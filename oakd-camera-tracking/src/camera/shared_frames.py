@@ -0,0 +1,261 @@
+"""Live view frames shared with a separate viewer process.
+
+Each camera gets one named shared memory segment holding a small header
+and two frame slots. The pipeline copies each frame with ``publish()``
+into the slot not holding the newest frame, and a viewer (see
+``view_shared_frames.py``) maps the same segment and reads the newest one
+at its own pace, so a slow or hung GUI never holds up the pipeline and
+frames never pass through a GUI backend in-process.
+
+Frame handover is best effort. NumPy stores carry no memory barriers, so
+on weakly ordered CPUs (ARM boards such as the Pi and Jetson) a reader
+could in rare cases still see a slot before all of its bytes land. Such a
+frame is only shown until the next one.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING
+
+import numpy as np
+from loguru import logger
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+# Segment header: sequence number, height, width, channels, the PID of the
+# publishing process, and a flag a viewer sets to ask the pipeline to stop
+# (uint64 each). The sequence counts published
+# frames; frame N is in slot N % 2, so the next publish writes the other
+# slot. A reader that sees the same sequence before and after its copy
+# has a whole frame.
+_HEADER_FIELDS: int = 6
+_HEADER_BYTES: int = _HEADER_FIELDS * np.dtype(np.uint64).itemsize
+_SEQUENCE: int = 0
+_OWNER_PID: int = 4
+_STOP_REQUESTED: int = 5
+_FRAME_SLOTS: int = 2
+
+
+def segment_name(cam_name: str) -> str:
+    """Return the shared memory segment name used for a camera.
+
+    Parameters
+    ----------
+    cam_name : str
+        Camera identifier (e.g. ``"CAM_A"``).
+
+    Returns
+    -------
+    str
+        Name the publisher creates and a viewer attaches to.
+    """
+    return f"oakd_{cam_name.lower()}"
+
+
+def _owner_pid(segment: shared_memory.SharedMemory) -> int | None:
+    """Return the PID recorded in a segment's header, or None if it has none."""
+    if segment.size < _HEADER_BYTES:
+        return None
+    header: NDArray[np.uint64] = np.ndarray(
+        (_HEADER_FIELDS,), dtype=np.uint64, buffer=segment.buf
+    )
+    pid = int(header[_OWNER_PID])
+    # Drop the view so the segment can be closed.
+    del header
+    return pid or None
+
+
+def _process_alive(pid: int) -> bool:
+    """Return whether a process with *pid* is running.
+
+    Only POSIX segments can outlive their publisher; elsewhere an existing
+    segment is always held open by a running process.
+    """
+    if os.name != "posix":
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True  # Exists, but belongs to another user.
+    return True
+
+
+class SharedFramePublisher:
+    """Publishes the newest live view frame per camera to shared memory.
+
+    Segments are created up front, one per camera, sized for frames of
+    *frame_shape*, and removed by ``close()``. Use from a single thread.
+
+    Parameters
+    ----------
+    cam_names : set[str]
+        Cameras whose frames will be published.
+    frame_shape : tuple[int, ...]
+        ``(height, width)`` or ``(height, width, channels)`` of every frame.
+
+    Raises
+    ------
+    FileExistsError
+        If a segment is still owned by another running pipeline.
+    OSError
+        If a segment cannot be created (e.g. shared memory unavailable).
+    """
+
+    def __init__(self, cam_names: set[str], frame_shape: tuple[int, ...]) -> None:
+        self._segments: dict[str, shared_memory.SharedMemory] = {}
+        self._headers: dict[str, NDArray[np.uint64]] = {}
+        self._frames: dict[str, NDArray[np.uint8]] = {}
+        height, width = frame_shape[:2]
+        channels = frame_shape[2] if len(frame_shape) > 2 else 1
+        try:
+            for cam_name in sorted(cam_names):
+                segment = self._create_segment(
+                    segment_name(cam_name),
+                    _HEADER_BYTES + _FRAME_SLOTS * height * width * channels,
+                )
+                header: NDArray[np.uint64] = np.ndarray(
+                    (_HEADER_FIELDS,), dtype=np.uint64, buffer=segment.buf
+                )
+                header[:] = (0, height, width, channels, os.getpid(), 0)
+                self._segments[cam_name] = segment
+                self._headers[cam_name] = header
+                self._frames[cam_name] = np.ndarray(
+                    (_FRAME_SLOTS, *frame_shape),
+                    dtype=np.uint8,
+                    buffer=segment.buf,
+                    offset=_HEADER_BYTES,
+                )
+                logger.info(f"Live view for {cam_name} shared as '{segment.name}'.")
+        except OSError:
+            self.close()
+            raise
+
+    @staticmethod
+    def _create_segment(name: str, size: int) -> shared_memory.SharedMemory:
+        """Create a named segment, replacing one left behind by a crashed run.
+
+        Raises
+        ------
+        FileExistsError
+            If the existing segment's publisher is still running.
+        """
+        try:
+            return shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Not tracked, or the resource tracker would remove the segment
+            # at exit even when it belongs to a live pipeline.
+            existing = shared_memory.SharedMemory(name=name, track=False)
+            try:
+                owner = _owner_pid(existing)
+            finally:
+                existing.close()
+            if owner is not None and _process_alive(owner):
+                raise FileExistsError(
+                    f"Shared memory segment '{name}' is in use by a running "
+                    f"pipeline (PID {owner})."
+                ) from None
+            existing.unlink()
+            return shared_memory.SharedMemory(name=name, create=True, size=size)
+
+    def publish(self, cam_name: str, frame: NDArray[np.uint8]) -> None:
+        """Copy *frame* into the camera's segment for viewers to pick up.
+
+        Parameters
+        ----------
+        cam_name : str
+            Camera the frame is from; must be one given at construction.
+        frame : NDArray[np.uint8]
+            Frame of the shape given at construction.
+        """
+        header = self._headers[cam_name]
+        sequence = int(header[_SEQUENCE]) + 1
+        np.copyto(self._frames[cam_name][sequence % _FRAME_SLOTS], frame)
+        header[_SEQUENCE] = sequence
+
+    def stop_requested(self) -> bool:
+        """Return whether a viewer has asked the pipeline to stop."""
+        return any(header[_STOP_REQUESTED] for header in self._headers.values())
+
+    def close(self) -> None:
+        """Release and remove every segment. Safe to call more than once."""
+        # Views into a segment must be dropped before it can be closed.
+        self._headers.clear()
+        self._frames.clear()
+        for segment in self._segments.values():
+            segment.close()
+            # Already gone if a viewer's resource tracker removed it.
+            with contextlib.suppress(FileNotFoundError):
+                segment.unlink()
+        self._segments.clear()
+
+
+class SharedFrameReader:
+    """Reads frames a ``SharedFramePublisher`` shares for one camera.
+
+    Parameters
+    ----------
+    cam_name : str
+        Camera to read (e.g. ``"CAM_A"``).
+
+    Raises
+    ------
+    FileNotFoundError
+        If no pipeline is currently sharing that camera.
+    """
+
+    def __init__(self, cam_name: str) -> None:
+        # Not tracked: the pipeline owns the segment and removes it itself.
+        self._segment = shared_memory.SharedMemory(
+            name=segment_name(cam_name), track=False
+        )
+        self._header: NDArray[np.uint64] | None = np.ndarray(
+            (_HEADER_FIELDS,), dtype=np.uint64, buffer=self._segment.buf
+        )
+        _, height, width, channels, _, _ = self._header.tolist()
+        shape = (height, width) if channels == 1 else (height, width, channels)
+        self._frames: NDArray[np.uint8] | None = np.ndarray(
+            (_FRAME_SLOTS, *shape),
+            dtype=np.uint8,
+            buffer=self._segment.buf,
+            offset=_HEADER_BYTES,
+        )
+        self._copy: NDArray[np.uint8] = np.empty(shape, dtype=np.uint8)
+        self._last_sequence: int = 0
+
+    def read(self) -> NDArray[np.uint8] | None:
+        """Return the newest frame if one was published since the last call.
+
+        Returns
+        -------
+        NDArray[np.uint8] | None
+            Copy of the frame (a reused buffer, overwritten by the next
+            successful read), or None if there is no new whole frame yet.
+        """
+        assert self._header is not None and self._frames is not None
+        sequence = int(self._header[_SEQUENCE])
+        if sequence == self._last_sequence:
+            return None
+        np.copyto(self._copy, self._frames[sequence % _FRAME_SLOTS])
+        if int(self._header[_SEQUENCE]) != sequence:
+            # A newer frame was published during the copy, and the one after
+            # it may be going into this slot; the next call picks it up.
+            return None
+        self._last_sequence = sequence
+        return self._copy
+
+    def request_stop(self) -> None:
+        """Ask the pipeline publishing this camera to stop."""
+        assert self._header is not None
+        self._header[_STOP_REQUESTED] = 1
+
+    def close(self) -> None:
+        """Detach from the segment, leaving it for the pipeline to remove."""
+        self._header = None
+        self._frames = None
+        self._segment.close()
@@ -6,9 +6,10 @@ from typing import TYPE_CHECKING, TypedDict
 
 import numpy as np
 
+from ..inference.detections import NO_TRACK_ID
+
 if TYPE_CHECKING:
     from numpy.typing import NDArray
-    from ultralytics.engine.results import Results
 
 
 class DetectionEstimate(TypedDict):
@@ -35,26 +36,27 @@ class TargetEstimator:
     """Estimates distance and bearing for each detected target.
 
     Combines a stereo depth frame (aligned to the colour camera) with YOLO
-    detection results to produce per-target 3D position estimates.
+    detections to produce per-target 3D position estimates.
 
     This class is stateless — a single instance can be reused across frames.
     """
 
     def estimate(
         self,
-        depth_frame: NDArray[np.uint16],
-        results: Results,
+        depth_frame: NDArray[np.uint16] | None,
+        detections: NDArray[np.float32],
         image_width: int,
     ) -> list[DetectionEstimate]:
-        """Estimate distance and bearing for every detection in *results*.
+        """Estimate distance and bearing for every row of *detections*.
 
         Parameters
         ----------
         depth_frame : NDArray[np.uint16]
             Depth map aligned to the colour camera frame. Pixel values are
             distances in millimetres (uint16). Zero indicates an invalid pixel.
-        results : Results
-            YOLO Results object from ``model.track()`` or ``model.predict()``.
+            If None, every ``distance_m`` is None.
+        detections : NDArray[np.float32]
+            ``(N, 7)`` detections for the frame from ``detection_array()``.
         image_width : int
             Width of the colour camera frame in pixels. Used to compute the
             normalised bearing.
@@ -67,45 +69,24 @@ class TargetEstimator:
             ``bearing_normalised``, ``bbox_xyxy``.
         """
         estimates: list[DetectionEstimate] = []
-
-        if results.boxes is None or len(results.boxes) == 0:
-            return estimates
-
-        frame_h, frame_w = depth_frame.shape[:2]
         half_width = image_width / 2.0
 
-        for i, box in enumerate(results.boxes):
-            x1, y1, x2, y2 = box.xyxy[0].tolist()
-
+        for x1, y1, x2, y2, track_id, conf, _ in detections.tolist():
             # --- bearing ---
             box_centre_x = (x1 + x2) / 2.0
             bearing = (box_centre_x - half_width) / half_width
 
-            # --- depth sampling: inner (1 - 2*_EDGE_CROP) of the box area ---
-            bw = x2 - x1
-            bh = y2 - y1
-            sx1 = int(max(0, x1 + _EDGE_CROP * bw))
-            sy1 = int(max(0, y1 + _EDGE_CROP * bh))
-            sx2 = int(min(frame_w, x2 - _EDGE_CROP * bw))
-            sy2 = int(min(frame_h, y2 - _EDGE_CROP * bh))
-
-            region = depth_frame[sy1:sy2, sx1:sx2]
-            valid = region[(region >= _MIN_DEPTH_MM) & (region <= _MAX_DEPTH_MM)]
-
-            if len(valid) < _MIN_VALID_PIXELS:
-                distance_m = None
-            else:
-                distance_m = float(np.median(valid)) / 1000.0
-
-            # --- track ID ---
-            track_id: int | None = None
-            if results.boxes.id is not None:
-                track_id = int(results.boxes.id[i].item())
+            # --- depth ---
+            distance_m = (
+                None
+                if depth_frame is None
+                else self._sample_distance(depth_frame, x1, y1, x2, y2)
+            )
 
             estimates.append(
                 {
-                    "track_id": track_id,
-                    "confidence": float(box.conf[0].item()),
+                    "track_id": None if track_id == NO_TRACK_ID else int(track_id),
+                    "confidence": conf,
                     "distance_m": distance_m,
                     "bearing_normalised": bearing,
                     "bbox_xyxy": [x1, y1, x2, y2],
@@ -113,3 +94,30 @@ class TargetEstimator:
             )
 
         return estimates
+
+    @staticmethod
+    def _sample_distance(
+        depth_frame: NDArray[np.uint16],
+        x1: float,
+        y1: float,
+        x2: float,
+        y2: float,
+    ) -> float | None:
+        """Return the median valid depth (metres) inside a box, or None.
+
+        Only the inner (1 - 2*_EDGE_CROP) of the box area is sampled.
+        """
+        frame_h, frame_w = depth_frame.shape[:2]
+        bw = x2 - x1
+        bh = y2 - y1
+        sx1 = int(max(0, x1 + _EDGE_CROP * bw))
+        sy1 = int(max(0, y1 + _EDGE_CROP * bh))
+        sx2 = int(min(frame_w, x2 - _EDGE_CROP * bw))
+        sy2 = int(min(frame_h, y2 - _EDGE_CROP * bh))
+
+        region = depth_frame[sy1:sy2, sx1:sx2]
+        valid = region[(region >= _MIN_DEPTH_MM) & (region <= _MAX_DEPTH_MM)]
+
+        if len(valid) < _MIN_VALID_PIXELS:
+            return None
+        return float(np.median(valid)) / 1000.0
@@ -0,0 +1,113 @@
+"""Constant-velocity box propagation between detector runs."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+from ultralytics.engine.results import Results
+
+from .detections import DETECTION_COLUMNS, NO_TRACK_ID, TRACK_ID
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+
+class BoxPropagator:
+    """Predicts boxes for frames the detector skips.
+
+    Holds the most recent detection result for one camera and, on frames
+    where inference is skipped, shifts each box by its track's velocity
+    (measured between the last two detections of that track ID) to give a
+    result for the current frame. Boxes without a track ID (or with
+    ``NO_TRACK_ID``), or seen for the first time, are held in place.
+
+    Frames are identified by their index in the camera's stream, so a
+    detection may arrive some frames after the frame it was run on and is
+    still extrapolated to the right place. Use one instance per camera,
+    with detections given in capture order.
+    """
+
+    def __init__(self) -> None:
+        self._result: Results | None = None
+        self._boxes: NDArray[np.float32] | None = None
+        # Per-box (x1, y1, x2, y2) displacement per frame.
+        self._velocity: NDArray[np.float32] | None = None
+        # Stream index of the frame ``_result`` was detected on.
+        self._frame_index: int = 0
+
+    def update(self, result: Results, frame_index: int) -> None:
+        """Record a fresh detection result.
+
+        Parameters
+        ----------
+        result : Results
+            Detector output for the frame at *frame_index*.
+        frame_index : int
+            Index of that frame in the camera's stream.
+        """
+        boxes = (
+            np.empty((0, DETECTION_COLUMNS), dtype=np.float32)
+            if result.boxes is None
+            else np.asarray(result.boxes.cpu().numpy().data, dtype=np.float32)
+        )
+        velocity = np.zeros((len(boxes), 4), dtype=np.float32)
+        previous = self._boxes
+        if (
+            previous is not None
+            and len(previous)
+            and len(boxes)
+            and boxes.shape[1] == DETECTION_COLUMNS
+            and previous.shape[1] == DETECTION_COLUMNS
+        ):
+            # Match each box to the previous box with its track ID with one
+            # sorted search rather than a Python loop over boxes.
+            prev_ids = previous[:, TRACK_ID]
+            ids = boxes[:, TRACK_ID]
+            order = np.argsort(prev_ids)
+            match = order[
+                np.minimum(
+                    np.searchsorted(prev_ids, ids, sorter=order), len(previous) - 1
+                )
+            ]
+            # Untracked boxes share NO_TRACK_ID but are not the same object.
+            matched = (prev_ids[match] == ids) & (ids != NO_TRACK_ID)
+            frames_elapsed = max(frame_index - self._frame_index, 1)
+            velocity[matched] = (
+                boxes[matched, :4] - previous[match[matched], :4]
+            ) / frames_elapsed
+
+        self._result = result
+        self._boxes = boxes
+        self._velocity = velocity
+        self._frame_index = frame_index
+
+    def predict(self, frame: NDArray[np.uint8], frame_index: int) -> Results | None:
+        """Extrapolate the last detection onto a later frame.
+
+        Parameters
+        ----------
+        frame : NDArray[np.uint8]
+            Frame the prediction is for; becomes the result's ``orig_img``.
+        frame_index : int
+            Index of *frame* in the camera's stream.
+
+        Returns
+        -------
+        Results | None
+            Predicted boxes for *frame*, or None if nothing has been
+            detected yet.
+        """
+        if self._result is None or self._boxes is None or self._velocity is None:
+            return None
+        boxes = self._boxes.copy()
+        boxes[:, :4] += self._velocity * (frame_index - self._frame_index)
+        height, width = frame.shape[:2]
+        boxes[:, [0, 2]] = np.clip(boxes[:, [0, 2]], 0, width)
+        boxes[:, [1, 3]] = np.clip(boxes[:, [1, 3]], 0, height)
+        return Results(
+            frame,
+            path=self._result.path,
+            names=self._result.names,
+            boxes=boxes,
+        )
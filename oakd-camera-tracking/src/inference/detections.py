@@ -0,0 +1,53 @@
+"""Dense per-frame detection arrays shared by depth estimation and drawing."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+    from ultralytics.engine.results import Results
+
+# Columns of a row returned by ``detection_array()``: x1, y1, x2, y2, track_id,
+# conf, cls. Boxes are in the result's pixel coordinates.
+DETECTION_COLUMNS: int = 7
+TRACK_ID: int = 4
+CONF: int = 5
+CLS: int = 6
+# Track ID column value for untracked boxes (model.predict()).
+NO_TRACK_ID: float = -1.0
+
+_EMPTY: NDArray[np.float32] = np.empty((0, DETECTION_COLUMNS), dtype=np.float32)
+_EMPTY.flags.writeable = False
+
+
+def detection_array(results: Results) -> NDArray[np.float32]:
+    """Return a result's boxes as one ``(N, 7)`` float32 host array.
+
+    Converting once per frame lets every consumer read plain columns
+    instead of iterating ``Boxes`` objects, each of which would copy its
+    own slice off the device.
+
+    Parameters
+    ----------
+    results : Results
+        YOLO result from ``model.track()``, ``model.predict()``, or
+        ``BoxPropagator.predict()``.
+
+    Returns
+    -------
+    NDArray[np.float32]
+        One row per box (see ``DETECTION_COLUMNS``). Untracked boxes have
+        ``NO_TRACK_ID`` in the track ID column. Must not be modified.
+    """
+    if results.boxes is None or len(results.boxes) == 0:
+        return _EMPTY
+    # Boxes.cpu()/.numpy() pass through boxes that already hold an ndarray,
+    # as those from BoxPropagator.predict() do; .data.cpu() would not.
+    data = np.asarray(results.boxes.cpu().numpy().data, dtype=np.float32)
+    if data.shape[1] == DETECTION_COLUMNS:
+        return data
+    # Untracked rows are x1, y1, x2, y2, conf, cls: insert the ID column.
+    return np.insert(data, TRACK_ID, NO_TRACK_ID, axis=1)
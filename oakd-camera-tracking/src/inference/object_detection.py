@@ -2,47 +2,318 @@
 
 from __future__ import annotations
 
+import os
+import time
+from collections.abc import Mapping, Sequence
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
+import cv2
 import numpy as np
+import torch
 from loguru import logger
 from ultralytics import YOLO
+from ultralytics.engine.results import Results
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
-    from ultralytics.engine.results import Results
+
+_ENGINE_SUFFIX: str = ".engine"
+_DEFAULT_IMGSZ: int = 640
+# Largest batch the exported TensorRT engine's dynamic profile accepts.
+_MAX_BATCH: int = 8
+# Tensor inputs skip Ultralytics' letterboxing, so uploads are padded
+# (bottom/right, with its grey) to a multiple of the model's largest stride.
+_MODEL_STRIDE: int = 32
+_PAD_VALUE: float = 114 / 255
+# Pinned host buffers used round-robin for uploads (double buffering).
+_UPLOAD_SLOTS: int = 2
+# Blank inferences run by warmup() unless the caller says otherwise.
+_WARMUP_RUNS: int = 3
+
+
+class DeviceFrame(NamedTuple):
+    """A frame uploaded to the GPU by ``ObjectDetection.upload()``."""
+
+    # (3, H, W) RGB in [0, 1], padded to a multiple of the model stride.
+    tensor: torch.Tensor
+    # Recorded on the copy stream once ``tensor`` is ready.
+    ready: torch.cuda.Event
+    # (height, width) of the frame before padding.
+    size: tuple[int, int]
 
 
 class ObjectDetection:
     """YOLO inference pipeline for object detection.
 
-    Loads a YOLO model and exposes a single ``run()`` method for per-frame
-    inference. Supports both track (persist=True) and predict modes based
-    on the model config.
+    Loads a YOLO model and exposes ``run()`` for per-frame inference and
+    ``run_batch()`` for batched inference. Supports both track (persist=True)
+    and predict modes based on the model config.
+
+    When ``export_engine`` is set in the model config and CUDA is available,
+    ``.pt`` weights are exported once to a TensorRT engine cached next to the
+    weights file, and the engine is loaded in their place. The engine is built
+    at FP16 when ``half`` is set, or INT8 when ``int8`` is set.
+
+    When ``fused_preprocess`` is set, host frames are resized, then scaled to
+    [0, 1], channel-swapped, and laid out as NCHW in a single pass, into
+    buffers reused across calls, instead of Ultralytics' multi-pass
+    letterbox preprocessing.
+
+    When ``async_upload`` is set and CUDA is available, ``upload()`` copies
+    frames to the GPU through pinned host memory on a dedicated CUDA stream,
+    so the next frame's transfer overlaps the current frame's inference.
 
     Parameters
     ----------
     model_path : Path
-        Absolute path to the .pt model weights file.
-    model_config : dict[str, object]
-        YOLO-compatible config dict. Keys must match those expected by
-        YOLO: conf, classes, persist, verbose.
+        Absolute path to the .pt weights file or a pre-built .engine file.
+    model_config : Mapping[str, object]
+        YOLO-compatible config mapping. Keys must match those expected by
+        YOLO: conf, classes, persist, verbose, imgsz. ``half`` and ``int8``
+        only set the engine export precision (and ``half`` the upload dtype);
+        they are not passed to inference.
+    calibration_data : Path | None
+        Ultralytics dataset YAML of representative frames used to calibrate
+        an INT8 engine export. Ignored unless ``int8`` is set.
     """
 
     # Keys forwarded to model.track() / model.predict() as kwargs.
-    _INFERENCE_KEYS = {"conf", "classes", "persist", "verbose"}
+    # ``half`` is left out: newer Ultralytics warns on every call that it is
+    # deprecated, and an engine's precision is fixed when it is exported.
+    _INFERENCE_KEYS = {"conf", "classes", "persist", "verbose", "imgsz"}
 
-    def __init__(self, model_path: Path, model_config: dict[str, object]) -> None:
+    def __init__(
+        self,
+        model_path: Path,
+        model_config: Mapping[str, object],
+        calibration_data: Path | None = None,
+    ) -> None:
         self._persist = bool(model_config.get("persist", False))
+        self._half = bool(model_config.get("half", False))
+        self._int8 = bool(model_config.get("int8", False))
+        self._calibration_data = calibration_data
+        imgsz: int = model_config.get("imgsz", _DEFAULT_IMGSZ)  # type: ignore[assignment]
+        self._imgsz = int(imgsz)
+        self._fused_preprocess = bool(model_config.get("fused_preprocess", False))
         self._inference_kwargs = {
             k: v for k, v in model_config.items() if k in self._INFERENCE_KEYS
         }
+        # predict() rejects track()'s persist argument.
+        self._predict_kwargs = {
+            k: v for k, v in self._inference_kwargs.items() if k != "persist"
+        }
+        self._configure_threads(model_config)
+        engine_path = self._resolve_engine(
+            model_path, bool(model_config.get("export_engine", False))
+        )
+        if engine_path is not None:
+            model_path = engine_path
         logger.info(f"Loading YOLO model from {model_path}")
         self._model = YOLO(str(model_path))
         logger.info("YOLO model loaded.")
 
-    def run(self, frame: NDArray[np.uint8]) -> Results | None:
+        self._copy_stream: torch.cuda.Stream | None = None
+        self._pinned: list[torch.Tensor | None] = [None] * _UPLOAD_SLOTS
+        self._pinned_free: list[torch.cuda.Event] = []
+        self._upload_slot = 0
+        # Reused by _to_blob(); reallocated when the input size changes or a
+        # larger batch arrives.
+        self._resized: NDArray[np.uint8] | None = None
+        self._blob: NDArray[np.float32] | None = None
+        if bool(model_config.get("async_upload", False)) and torch.cuda.is_available():
+            self._copy_stream = torch.cuda.Stream()
+            self._pinned_free = [torch.cuda.Event() for _ in range(_UPLOAD_SLOTS)]
+            logger.info("Uploading frames to the GPU on a separate CUDA stream.")
+
+    @staticmethod
+    def _configure_threads(model_config: Mapping[str, object]) -> None:
+        """Set PyTorch's CPU thread pools from the model config.
+
+        ``num_threads`` and ``num_interop_threads`` are applied whenever they
+        are set. Without CUDA they default to half the cores and 1: the
+        small tensors of a YOLO nano model run slower when every op is
+        split across all cores.
+        """
+        num_threads: int | None = model_config.get("num_threads")  # type: ignore[assignment]
+        num_interop: int | None = model_config.get("num_interop_threads")  # type: ignore[assignment]
+        if not torch.cuda.is_available():
+            num_threads = num_threads or max(1, (os.cpu_count() or 1) // 2)
+            num_interop = num_interop or 1
+        if num_threads:
+            torch.set_num_threads(int(num_threads))
+        if num_interop:
+            try:
+                torch.set_num_interop_threads(int(num_interop))
+            except RuntimeError as exc:
+                # Only settable before PyTorch runs its first parallel op.
+                logger.warning(f"Could not set PyTorch inter-op threads: {exc}")
+        logger.info(
+            f"PyTorch threads: {torch.get_num_threads()} intra-op, "
+            f"{torch.get_num_interop_threads()} inter-op."
+        )
+
+    def _resolve_engine(self, model_path: Path, export_engine: bool) -> Path | None:
+        """Return the TensorRT engine to load, exporting it if required.
+
+        Parameters
+        ----------
+        model_path : Path
+            Configured model file.
+        export_engine : bool
+            Whether exporting ``.pt`` weights to TensorRT is enabled.
+
+        Returns
+        -------
+        Path | None
+            Path to the engine file, or None if the weights should be loaded
+            as-is (engine export disabled, CUDA unavailable, or export failed).
+        """
+        if model_path.suffix == _ENGINE_SUFFIX:
+            return model_path
+        if not export_engine or not torch.cuda.is_available():
+            return None
+
+        # Cache name records the precision so switching half/int8 rebuilds it.
+        precision = "int8" if self._int8 else "fp16" if self._half else "fp32"
+        engine_path = model_path.with_name(
+            f"{model_path.stem}_{precision}{_ENGINE_SUFFIX}"
+        )
+        # An INT8 engine is only as good as its calibration, so new
+        # calibration data invalidates it just as new weights do.
+        sources = [model_path]
+        if self._int8 and self._calibration_data is not None:
+            sources.append(self._calibration_data)
+        if engine_path.exists() and all(
+            engine_path.stat().st_mtime >= source.stat().st_mtime for source in sources
+        ):
+            logger.info(f"Using cached TensorRT engine {engine_path}")
+            return engine_path
+
+        logger.info(
+            f"Exporting {model_path.name} to {precision} TensorRT engine at "
+            f"{engine_path}. This is a one-off that can take several minutes; "
+            "capture starts once it finishes..."
+        )
+        export_kwargs: dict[str, object] = {}
+        if self._int8 and self._calibration_data is not None:
+            export_kwargs["data"] = str(self._calibration_data)
+        elif self._int8:
+            logger.warning(
+                "INT8 export without int8_calibration_data calibrates on "
+                "Ultralytics' default dataset; accuracy may drop noticeably."
+            )
+        try:
+            exported = YOLO(str(model_path)).export(
+                format="engine",
+                half=self._half,
+                int8=self._int8,
+                imgsz=self._imgsz,
+                device=0,
+                dynamic=True,
+                batch=_MAX_BATCH,
+                **export_kwargs,
+            )
+        except Exception as exc:
+            logger.warning(f"TensorRT export failed, using PyTorch weights: {exc}")
+            return None
+        # Ultralytics writes <stem>.engine next to the weights; move it to the
+        # precision-tagged cache name.
+        return Path(exported).replace(engine_path)
+
+    def warmup(
+        self,
+        shape: tuple[int, ...],
+        batch_size: int = 1,
+        runs: int = _WARMUP_RUNS,
+        upload: bool = True,
+    ) -> None:
+        """Run the detector on blank frames to pay its one-off start-up costs.
+
+        The first inferences are many times slower than the rest (CUDA
+        context and kernel selection, engine allocation). Calling this
+        before capture starts keeps that stall off the first real frames.
+        Blank frames are always run through ``predict()``, even in track
+        mode, so they never enter the tracker's persistent state.
+
+        Parameters
+        ----------
+        shape : tuple[int, ...]
+            Shape of the frames that will be passed to ``run_batch()``.
+        batch_size : int
+            Frames per warm-up call; pass the batch size used at runtime.
+        runs : int
+            Number of warm-up calls.
+        upload : bool
+            Whether to pass frames through ``upload()`` (when it is enabled),
+            as the caller will do with live frames.
+        """
+        frame = np.zeros(shape, dtype=np.uint8)
+        started = time.perf_counter()
+        for _ in range(runs):
+            frames = [
+                (self.upload(frame) if upload else None) or frame
+                for _ in range(min(batch_size, _MAX_BATCH))
+            ]
+            self._infer(frames, track=False)
+        logger.info(
+            f"Detector warmed up in {time.perf_counter() - started:.2f}s "
+            f"({runs} x {batch_size} frame(s))."
+        )
+
+    def upload(self, frame: NDArray[np.uint8]) -> DeviceFrame | None:
+        """Start copying a BGR frame to the GPU without waiting for it.
+
+        The frame is staged in a pinned host buffer, then transferred and
+        converted to the model's input layout on the copy stream. Only the
+        staging copy runs on the calling thread. Callers must use a single
+        thread for uploads.
+
+        Parameters
+        ----------
+        frame : NDArray[np.uint8]
+            BGR frame at the detector's input resolution.
+
+        Returns
+        -------
+        DeviceFrame | None
+            Handle to pass to ``run()`` or ``run_batch()`` in place of the
+            frame, or None if asynchronous upload is disabled.
+        """
+        if self._copy_stream is None:
+            return None
+        slot = self._upload_slot
+        self._upload_slot = (slot + 1) % _UPLOAD_SLOTS
+        pinned = self._pinned[slot]
+        if pinned is None or tuple(pinned.shape) != frame.shape:
+            pinned = torch.empty(frame.shape, dtype=torch.uint8, pin_memory=True)
+            self._pinned[slot] = pinned
+        else:
+            # Wait for this slot's previous transfer before overwriting it.
+            self._pinned_free[slot].synchronize()
+        np.copyto(pinned.numpy(), frame)
+
+        height, width = frame.shape[:2]
+        with torch.cuda.stream(self._copy_stream):
+            gpu = pinned.to("cuda", non_blocking=True)
+            self._pinned_free[slot].record(self._copy_stream)
+            # HWC BGR uint8 -> CHW RGB float in [0, 1], padded bottom/right.
+            chw = gpu.permute(2, 0, 1).flip(0)
+            chw = (chw.half() if self._half else chw.float()).div_(255)
+            chw = torch.nn.functional.pad(
+                chw,
+                (0, -width % _MODEL_STRIDE, 0, -height % _MODEL_STRIDE),
+                value=_PAD_VALUE,
+            )
+            ready = torch.cuda.Event()
+            ready.record(self._copy_stream)
+        return DeviceFrame(chw, ready, (height, width))
+
+    def run(
+        self,
+        frame: NDArray[np.uint8] | DeviceFrame,
+        output_frame: NDArray[np.uint8] | None = None,
+    ) -> Results | None:
         """Run inference on a single frame.
 
         Uses ``model.track()`` when persist=True (multi-frame tracking),
@@ -50,24 +321,204 @@ class ObjectDetection:
 
         Parameters
         ----------
-        frame : NDArray[np.uint8]
-            BGR frame array to run inference on.
+        frame : NDArray[np.uint8] | DeviceFrame
+            BGR frame array to run inference on, or its ``upload()`` handle.
+        output_frame : NDArray[np.uint8] | None
+            Full-size frame that *frame* was scaled down from. If given, the
+            returned boxes are mapped to its coordinates and it becomes the
+            result's ``orig_img``.
 
         Returns
         -------
         Results | None
             YOLO Results object for the frame, or None if inference fails.
         """
+        outputs = None if output_frame is None else [output_frame]
+        return self.run_batch([frame], outputs)[0]
+
+    def run_batch(
+        self,
+        frames: Sequence[NDArray[np.uint8] | DeviceFrame],
+        output_frames: list[NDArray[np.uint8]] | None = None,
+    ) -> list[Results | None]:
+        """Run inference on several frames with one model call per batch.
+
+        Frames are passed to YOLO as a list so they are stacked into a single
+        ``(N, 3, H, W)`` input, amortising per-call overhead across the batch.
+        Lists longer than the engine's maximum batch are split into chunks.
+        When tracking, frames must be in capture order.
+
+        Parameters
+        ----------
+        frames : Sequence[NDArray[np.uint8] | DeviceFrame]
+            BGR frames to run inference on, in capture order, or their
+            ``upload()`` handles (all of one size). Do not mix the two.
+        output_frames : list[NDArray[np.uint8]] | None
+            Full-size frames matching *frames* one-to-one. If given, each
+            result is rescaled to its full-size frame (see ``run()``).
+
+        Returns
+        -------
+        list[Results | None]
+            One entry per input frame, in the same order. Entries are None
+            for frames whose inference failed.
+        """
+        results: list[Results | None] = []
+        for start in range(0, len(frames), _MAX_BATCH):
+            results.extend(self._infer(frames[start : start + _MAX_BATCH]))
+        if output_frames is None:
+            host_frames = [f for f in frames if not isinstance(f, DeviceFrame)]
+            if not (self._fused_preprocess and host_frames):
+                return results
+            # Fused results are in blob coordinates; map them onto the inputs.
+            output_frames = host_frames
+        return [
+            None
+            if result is None
+            else self._rescale(result, output, self._unpadded_size(frame))
+            for result, output, frame in zip(
+                results, output_frames, frames, strict=True
+            )
+        ]
+
+    def _unpadded_size(
+        self, frame: NDArray[np.uint8] | DeviceFrame
+    ) -> tuple[int, int] | None:
+        """Return the size *frame* had in the model input before padding, if padded."""
+        if isinstance(frame, DeviceFrame):
+            return frame.size
+        if self._fused_preprocess:
+            return self._scaled_size(*frame.shape[:2])
+        return None
+
+    def _infer(
+        self,
+        frames: Sequence[NDArray[np.uint8] | DeviceFrame],
+        track: bool | None = None,
+    ) -> list[Results | None]:
+        """Run one track/predict call over *frames* and return per-frame results.
+
+        *track* selects ``track()`` over ``predict()``; None follows
+        ``persist`` from the model config.
+        """
+        device_frames = [f for f in frames if isinstance(f, DeviceFrame)]
+        source: list[NDArray[np.uint8] | DeviceFrame] | torch.Tensor = list(frames)
+        if device_frames:
+            # Order the copy stream's work before inference on this stream,
+            # and keep the tensors alive until that inference has used them.
+            stream = torch.cuda.current_stream()
+            for device_frame in device_frames:
+                stream.wait_event(device_frame.ready)
+                device_frame.tensor.record_stream(stream)
+            source = torch.stack([f.tensor for f in device_frames])
+        elif self._fused_preprocess:
+            source = torch.from_numpy(self._to_blob(list(frames)))  # type: ignore[arg-type]
         try:
-            if self._persist:
-                raw = self._model.track(frame, **self._inference_kwargs)
+            if self._persist if track is None else track:
+                raw = self._model.track(source, **self._inference_kwargs)
             else:
-                raw = self._model.predict(frame, **self._inference_kwargs)
+                raw = self._model.predict(source, **self._predict_kwargs)
         except Exception as exc:
-            logger.warning(f"Inference failed on frame: {exc}")
-            return None
+            logger.warning(f"Inference failed on {len(frames)} frame(s): {exc}")
+            return [None] * len(frames)
 
-        if not raw:
-            return None
-        result: Results = raw[0]
-        return result
+        if not raw or len(raw) != len(frames):
+            return [None] * len(frames)
+        return list(raw)
+
+    def _to_blob(self, frames: list[NDArray[np.uint8]]) -> NDArray[np.float32]:
+        """Preprocess BGR frames into a model-ready NCHW batch.
+
+        Frames are resized to ``imgsz`` on their longer side, keeping their
+        aspect, then scaled to [0, 1], converted BGR to RGB, and transposed
+        to CHW by one ufunc pass. The blob is padded bottom/right with grey
+        up to a multiple of the model stride, as ``upload()`` does. Both
+        steps write into preallocated buffers, and frames already at the
+        scaled size skip the resize. Boxes come back in blob coordinates and
+        are mapped to the frames by ``_rescale()``.
+
+        Parameters
+        ----------
+        frames : list[NDArray[np.uint8]]
+            BGR frames of one size.
+
+        Returns
+        -------
+        NDArray[np.float32]
+            ``(N, 3, H, W)`` float32 batch. This is a reused buffer, valid
+            until the next call.
+        """
+        height, width = self._scaled_size(*frames[0].shape[:2])
+        blob_shape = (height + -height % _MODEL_STRIDE, width + -width % _MODEL_STRIDE)
+        count = len(frames)
+        if (
+            self._blob is None
+            or self._resized is None
+            or self._resized.shape[1:3] != (height, width)
+            or len(self._blob) < count
+        ):
+            self._resized = np.empty((count, height, width, 3), dtype=np.uint8)
+            # Only the top-left region is rewritten, so the padding stays grey.
+            self._blob = np.full((count, 3, *blob_shape), _PAD_VALUE, dtype=np.float32)
+        for frame, resized, chw in zip(frames, self._resized, self._blob, strict=False):
+            source = frame
+            if frame.shape[:2] != (height, width):
+                cv2.resize(frame, (width, height), dst=resized)
+                source = resized
+            # HWC BGR -> CHW RGB, scaled to [0, 1], without temporaries.
+            np.multiply(
+                source.transpose(2, 0, 1)[::-1],
+                1 / 255,
+                out=chw[:, :height, :width],
+                dtype=np.float32,
+            )
+        return self._blob[:count]
+
+    def _scaled_size(self, height: int, width: int) -> tuple[int, int]:
+        """Return ``(height, width)`` of a frame scaled to ``imgsz``, before padding."""
+        scale = self._imgsz / max(height, width)
+        return max(1, round(height * scale)), max(1, round(width * scale))
+
+    @staticmethod
+    def _rescale(
+        result: Results,
+        output_frame: NDArray[np.uint8],
+        source_size: tuple[int, int] | None = None,
+    ) -> Results:
+        """Map a result from its (scaled-down) input frame onto *output_frame*.
+
+        Parameters
+        ----------
+        result : Results
+            YOLO result produced from a scaled-down copy of *output_frame*.
+        output_frame : NDArray[np.uint8]
+            Full-size frame to express the boxes in.
+        source_size : tuple[int, int] | None
+            ``(height, width)`` of the input before padding, if it was padded
+            on the bottom/right; otherwise the result's ``orig_shape``.
+
+        Returns
+        -------
+        Results
+            A result whose ``orig_img`` is *output_frame* and whose boxes are
+            in its pixel coordinates, clipped to its edges. *result* itself if
+            sizes already match.
+        """
+        src_h, src_w = result.orig_shape if source_size is None else source_size
+        dst_h, dst_w = output_frame.shape[:2]
+        if (src_h, src_w) == (dst_h, dst_w) == tuple(result.orig_shape):
+            return result
+        boxes = None
+        if result.boxes is not None:
+            boxes = result.boxes.data.clone()
+            # Boxes are only clipped to the padded input, so clip them to the
+            # unpadded frame before scaling or they overshoot the output.
+            boxes[:, [0, 2]] = boxes[:, [0, 2]].clamp(0, src_w) * (dst_w / src_w)
+            boxes[:, [1, 3]] = boxes[:, [1, 3]].clamp(0, src_h) * (dst_h / src_h)
+        return Results(
+            output_frame,
+            path=result.path,
+            names=result.names,
+            boxes=boxes,
+            speed=result.speed,
+        )
@@ -2,33 +2,97 @@
 
 This module coordinates the camera feed, YOLO model inference, and tracking
 components to detect and track boats in video footage.
+
+Capture and inference run as separate threads connected by a small bounded
+queue, and each recorder writes to disk on its own thread, so every stage
+works on a different frame concurrently and throughput is set by the
+slowest stage rather than the sum of all of them. Display stays on the main
+thread, as OpenCV's GUI requires.
 """
 
 from __future__ import annotations
 
+import contextlib
+import os
+import queue
 import sys
+import threading
 import time
 from datetime import datetime
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 
 import cv2
+import numpy as np
 from loguru import logger
 
 from .camera.camera_access import CameraAccess
-from .camera.camera_recording import CameraRecording, GyroRecorder
+from .camera.camera_recording import CameraRecording, DetectionRecorder, GyroRecorder
 from .camera.camera_tracking import CameraTracking
+from .camera.shared_frames import SharedFramePublisher
 from .depth_perception.target_estimator import TargetEstimator
-from .inference.object_detection import ObjectDetection
+from .inference.box_propagation import BoxPropagator
+from .inference.detections import detection_array
+from .inference.object_detection import DeviceFrame, ObjectDetection
 
 if TYPE_CHECKING:
-    import numpy as np
+    from collections.abc import Callable, Iterator
+
     from numpy.typing import NDArray
+    from ultralytics.engine.results import Results
 
+    from .depth_perception.target_estimator import DetectionEstimate
     from .settings import Settings
 
+    # Per-camera output step built by ``_build_emitter()``: takes the packet,
+    # its annotated copy (if any), and its detections (if any).
+    _Emitter = Callable[
+        ["_FramePacket", "NDArray[np.uint8] | None", "list[DetectionEstimate] | None"],
+        None,
+    ]
+
 _FPS: int = 28
-_IDLE_SLEEP_S: float = 0.001
 _QUIT_KEY: int = ord("q")
+# Maximum time a partially filled inference batch waits before being flushed.
+_BATCH_TIMEOUT_S: float = 0.25
+# Capacity of the queues between stages (and, plus one batch, of each
+# recorder's queue). A full queue drops the incoming frame so that a slow
+# stage never stalls capture.
+_STAGE_QUEUE_SIZE: int = 2
+# Camera frame buffers that may be referenced by frames in flight (the
+# inference queue, the frame each stage is working on, the display slot,
+# and the detector worker's slot and frame), on top of those held by
+# inference batches. Recorders copy frames, so their queues hold none.
+_FRAME_BUFFER_HEADROOM: int = _STAGE_QUEUE_SIZE + 6
+# Annotated frames per camera that may be in use at once: the display slot,
+# the frame being shown, and the one being drawn. Recorders copy them.
+_ANNOTATION_BUFFER_COUNT: int = 3
+# Interval between aggregate inference statistics at DEBUG level. Nothing is
+# logged per frame.
+_STATS_INTERVAL_S: float = 1.0
+# SCHED_FIFO priority of the capture thread when ``realtime`` is enabled
+# (Linux only). The CPUs each stage is pinned to come from the pipeline
+# config; recorder writer threads keep the process's original affinity.
+_CAPTURE_FIFO_PRIORITY: int = 50
+# Timeout for blocking queue reads, so stages notice shutdown promptly.
+_QUEUE_POLL_S: float = 0.1
+
+
+class _FramePacket(NamedTuple):
+    """Frame handed between pipeline stages."""
+
+    cam_name: str
+    frame: NDArray[np.uint8]
+    depth_frame: NDArray[np.uint16] | None
+    # Device-scaled copy of ``frame`` for the detector, if available.
+    inference_frame: NDArray[np.uint8] | None = None
+    # ``inference_frame`` already on its way to the GPU, if async upload is on.
+    device_frame: DeviceFrame | None = None
+    # Whether this frame goes to the detector (see ``detection_stride``).
+    detect: bool = True
+    # Position of the frame in its camera's stream, for box extrapolation.
+    frame_index: int = 0
+    # Capture time on the device clock (see ``CameraAccess.get_frames()``).
+    timestamp_s: float = 0.0
 
 
 class Pipeline:
@@ -50,11 +114,52 @@ class Pipeline:
         # Populated in _setup_recorders() after camera connects so that
         # names are sourced from the device rather than hardcoded here.
         self._recorders: dict[str, CameraRecording] = {}
+        self._detection_recorders: dict[str, DetectionRecorder] = {}
         self._recording_started: dict[str, bool] = {}
+        # Frames each camera's recorder accepted, for detection sidecars.
+        self._frames_recorded: dict[str, int] = {}
+        # Output step per camera, built in _setup_emitters() once recorders
+        # exist.
+        self._emitters: dict[str, _Emitter] = {}
         self._gyro_started: bool = False
         self._session_timestamp: str = self._generate_session_timestamp()
         # Populated after camera.start() from hardware metadata.
         self._colour_camera_names: set[str] = set()
+        # Per-camera detection stride state, owned by the capture stage.
+        self._frames_until_detection: dict[str, int] = {}
+        self._frames_captured: dict[str, int] = {}
+        self._propagators: dict[str, BoxPropagator] = {}
+        # Newest (result, frame index) per camera from the detector worker,
+        # taken by the inference stage when async detection is on.
+        self._latest_detections: dict[str, tuple[Results, int]] = {}
+        # Inference throughput since the last stats log, owned by that stage.
+        self._stats_frames: int = 0
+        self._stats_detector_frames: int = 0
+        self._stats_detections: int = 0
+        self._stats_since: float = time.monotonic()
+        # Stage hand-off. Threads are created in _start_stages().
+        self._stop_event = threading.Event()
+        # Capture may hand over a whole batch at once when batching.
+        self._infer_queue: queue.Queue[_FramePacket] = queue.Queue(
+            maxsize=_STAGE_QUEUE_SIZE
+            + (self._settings.inference_batch_size if self.batching_enabled else 0)
+        )
+        self._display_queue: queue.Queue[_FramePacket] = queue.Queue(maxsize=1)
+        # Holds only the newest frame due for detection (drop-old).
+        self._detect_slot: queue.Queue[_FramePacket] = queue.Queue(maxsize=1)
+        # Copies of the detector input for frames in the slot, as capture
+        # recycles its ring buffers while the worker may still be reading:
+        # one buffer can be with the worker and the other in the slot.
+        self._detect_buffers: list[NDArray[np.uint8] | None] = [None, None]
+        self._detect_buffer: int = 0
+        self._capture_thread: threading.Thread | None = None
+        self._infer_thread: threading.Thread | None = None
+        # CPU affinity the process started with, saved before any thread is
+        # pinned when ``realtime`` is on; None otherwise.
+        self._default_cpus: set[int] | None = None
+        # Set by the display loop when live view goes to shared memory.
+        self._frame_publisher: SharedFramePublisher | None = None
+        self._detect_thread: threading.Thread | None = None
 
     # ------------------------------------------------------------------ #
     # Properties                                                           #
@@ -70,6 +175,45 @@ class Pipeline:
         """Whether to record each camera feed to disk."""
         return bool(self._settings.recording_enabled)
 
+    @property
+    def annotation_enabled(self) -> bool:
+        """Whether detections are drawn onto frames.
+
+        Drawing is only needed for live view or annotated recordings; for
+        raw recordings detections go to a JSONL sidecar instead.
+        """
+        return self.live_view_enabled or (
+            self.recording_enabled and self._settings.annotate_recording
+        )
+
+    @property
+    def batching_enabled(self) -> bool:
+        """Whether colour frames are grouped into batched detector calls.
+
+        Batching adds up to one batch of latency, so it is only used when
+        live view is off; live view keeps the single-frame path.
+        """
+        return (
+            self._detector is not None
+            and self._settings.inference_batch_size > 1
+            and not self.live_view_enabled
+        )
+
+    @property
+    def async_detection_enabled(self) -> bool:
+        """Whether the detector runs on a worker thread of its own.
+
+        The inference stage then emits every frame at once with the worker's
+        latest boxes, extrapolated, instead of waiting for the detector.
+        Batching already trades latency for throughput, so it takes
+        precedence.
+        """
+        return (
+            self._detector is not None
+            and self._settings.async_detection
+            and not self.batching_enabled
+        )
+
     @property
     def _primary_camera(self) -> str:
         """Name of the first camera reported by the device.
@@ -95,11 +239,30 @@ class Pipeline:
             fps=_FPS,
             colour_resolution=self._settings.colour_camera_resolution,
             mono_resolution=self._settings.mono_camera_resolution,
+            inference_resolution=(
+                self._settings.inference_resolution
+                if self._settings.inference_enabled
+                else None
+            ),
+            # Frames in flight between stages (a batch read by capture and
+            # queued for inference, and a pending batch) must not be
+            # overwritten by the camera's buffer ring.
+            frame_buffer_count=2 * self._settings.inference_batch_size
+            + _FRAME_BUFFER_HEADROOM,
+            # Without live view, latency matters less than keeping every
+            # frame: queue up to a batch of them while inference is busy.
+            frame_queue_size=(
+                1
+                if self._settings.live_view_enabled
+                else self._settings.inference_batch_size
+            ),
         )
 
     def _create_tracker(self) -> CameraTracking | None:
         """Create a tracker instance if inference is enabled."""
-        return CameraTracking() if self._settings.inference_enabled else None
+        if not self._settings.inference_enabled:
+            return None
+        return CameraTracking(buffer_count=_ANNOTATION_BUFFER_COUNT)
 
     def _create_detector(self) -> ObjectDetection | None:
         """Create an object detector if inference is enabled."""
@@ -108,6 +271,7 @@ class Pipeline:
         return ObjectDetection(
             model_path=self._settings.model_path,
             model_config=self._settings.model_config,
+            calibration_data=self._settings.calibration_data_path,
         )
 
     def _create_gyro_recorder(self) -> GyroRecorder | None:
@@ -128,8 +292,9 @@ class Pipeline:
         """Start the pipeline and enter the main processing loop.
 
         Connects to the camera, sets up recorders based on the device's
-        reported camera list, then processes frames until 'q' is pressed
-        or the pipeline is interrupted.
+        reported camera list, starts the capture, inference, and recording
+        stages, then displays frames until 'q' is pressed or the pipeline
+        is interrupted.
         """
         logger.info("Starting pipeline...")
         try:
@@ -140,6 +305,14 @@ class Pipeline:
 
         self._colour_camera_names = self._camera.get_colour_camera_names()
         self._setup_recorders()
+        self._setup_emitters()
+        self._warm_up()
+        if self._settings.realtime:
+            if hasattr(os, "sched_getaffinity"):
+                self._default_cpus = os.sched_getaffinity(0)
+            # Each stage thread pins itself; this covers the display loop.
+            self._pin_current_thread(self._settings.main_cpus)
+        self._start_stages()
 
         try:
             self._main_loop()
@@ -160,94 +333,755 @@ class Pipeline:
             self._recorders[cam_name] = CameraRecording(
                 output_dir=self._settings.output_dir,
                 file_prefix=f"{cam_name.lower()}_recording",
+                # Inference emits a whole batch at once, so accept one. The
+                # recorder copies each frame into a pool buffer of its own.
+                queue_size=_STAGE_QUEUE_SIZE + self._settings.inference_batch_size,
             )
             self._recording_started[cam_name] = False
+            self._frames_recorded[cam_name] = 0
+            if (
+                self._detector is not None
+                and not self._settings.annotate_recording
+                and cam_name in self._colour_camera_names
+            ):
+                self._detection_recorders[cam_name] = DetectionRecorder(
+                    output_dir=self._settings.output_dir,
+                    file_prefix=f"{cam_name.lower()}_detections",
+                )
+
+    def _setup_emitters(self) -> None:
+        """Build each camera's output step for the features enabled."""
+        for cam_name in self._camera.get_camera_names():
+            self._emitters[cam_name] = self._build_emitter(cam_name)
+
+    def _build_emitter(self, cam_name: str) -> _Emitter:
+        """Return a function that records and/or displays a camera's frames.
+
+        Whether a camera is recorded, has a detection sidecar, or is shown
+        is fixed once the recorders are set up, so those checks are made
+        here once rather than for every frame. The returned function does
+        only the steps that apply.
+
+        Parameters
+        ----------
+        cam_name : str
+            Camera identifier.
+
+        Returns
+        -------
+        _Emitter
+            Output step for *cam_name*; see ``_emit_frame()``.
+        """
+        recorder = self._recorders.get(cam_name)
+        detection_recorder = self._detection_recorders.get(cam_name)
+        record_annotated = self._settings.annotate_recording
+        frames_recorded = self._frames_recorded
+        lazy_start_recorder = self._lazy_start_recorder
+        display_queue = self._display_queue
+        offer = self._offer
+
+        def record(
+            packet: _FramePacket,
+            annotated: NDArray[np.uint8] | None,
+            estimates: list[DetectionEstimate] | None,
+        ) -> None:
+            assert recorder is not None
+            lazy_start_recorder(cam_name, packet.frame)
+            if not recorder.write(
+                annotated
+                if annotated is not None and record_annotated
+                else packet.frame
+            ):
+                # Dropped frame: leave its sidecar line out too, so that
+                # sidecar indices keep matching frames in the video.
+                return
+            if detection_recorder is not None:
+                detection_recorder.write(
+                    frames_recorded[cam_name], packet.timestamp_s, estimates or []
+                )
+            frames_recorded[cam_name] += 1
+
+        def show(
+            packet: _FramePacket,
+            annotated: NDArray[np.uint8] | None,
+            estimates: list[DetectionEstimate] | None,
+        ) -> None:
+            # Display only ever needs the newest frame: replace any unshown one.
+            with contextlib.suppress(queue.Empty):
+                display_queue.get_nowait()
+            shown = packet.frame if annotated is None else annotated
+            offer(display_queue, _FramePacket(cam_name, shown, None))
+
+        def record_and_show(
+            packet: _FramePacket,
+            annotated: NDArray[np.uint8] | None,
+            estimates: list[DetectionEstimate] | None,
+        ) -> None:
+            record(packet, annotated, estimates)
+            show(packet, annotated, estimates)
+
+        def discard(
+            packet: _FramePacket,
+            annotated: NDArray[np.uint8] | None,
+            estimates: list[DetectionEstimate] | None,
+        ) -> None:
+            return
+
+        displayed = self.live_view_enabled and cam_name in self._colour_camera_names
+        if recorder is not None:
+            return record_and_show if displayed else record
+        return show if displayed else discard
+
+    def _warm_up(self) -> None:
+        """Pay the detector's start-up costs before capture.
+
+        Runs blank frames of the size and batch the inference stage will
+        use. They go through ``predict()``, so in track mode the tracker
+        starts from the first real frame with no blank frames in its state.
+        """
+        if self._detector is None:
+            return
+        width, height = (
+            self._settings.inference_resolution
+            or self._settings.colour_camera_resolution
+        )
+        self._detector.warmup(
+            (height, width, 3),
+            batch_size=(
+                self._settings.inference_batch_size if self.batching_enabled else 1
+            ),
+            # Only device-scaled frames are uploaded (see _dispatch_frame());
+            # full frames take the host path.
+            upload=self._settings.inference_resolution is not None,
+        )
+
+    def _start_stages(self) -> None:
+        """Create and start the capture, inference, and detector threads.
+
+        All threads are created before any is started so that each stage
+        can check whether the one feeding it has finished.
+        """
+        self._capture_thread = threading.Thread(
+            target=self._capture_loop, name="capture", daemon=True
+        )
+        if self._detector is not None:
+            self._infer_thread = threading.Thread(
+                target=self._infer_loop, name="inference", daemon=True
+            )
+        if self.async_detection_enabled:
+            self._detect_thread = threading.Thread(
+                target=self._detect_loop, name="detector", daemon=True
+            )
+        for thread in (self._capture_thread, self._infer_thread, self._detect_thread):
+            if thread is not None:
+                thread.start()
 
     # ------------------------------------------------------------------ #
-    # Main loop                                                            #
+    # Main loop (display)                                                  #
     # ------------------------------------------------------------------ #
 
     def _main_loop(self) -> None:
-        while True:
-            any_frame = False
+        """Show processed frames and watch for 'q' until a stage stops.
 
-            for cam_name in self._camera.get_camera_names():
-                frame = self._camera.get_frame(cam_name)
-                if frame is not None:
-                    self._process_frame(cam_name, frame)
-                    any_frame = True
+        When live view is disabled nothing is queued for display and this
+        simply waits, keeping the main thread free to receive Ctrl+C. With
+        ``shared_memory_view`` there is no window to press 'q' in, so the
+        loop instead stops when a viewer presses 's'.
+        Each window is redrawn at most ``display_max_fps`` times a second;
+        GUI events are pumped with ``pollKey()`` on every pass, including
+        ones where no frame arrived, so windows stay responsive while the
+        camera stalls. Unlike ``waitKey(1)``, ``pollKey()`` does not sleep.
+        See ``_build_show()`` for where frames are shown.
+        """
+        titles = {name: f"OAK-D Feed - {name}" for name in self._colour_camera_names}
+        show = self._build_show(titles)
+        publisher = self._frame_publisher
+        windowed = self.live_view_enabled and publisher is None
+        max_fps = self._settings.display_max_fps
+        min_interval = 1 / max_fps if max_fps > 0 else 0.0
+        last_shown: dict[str, float] = {}
+        # Bound once: this loop runs for every displayed frame.
+        stopped = self._stop_event.is_set
+        next_packet = self._display_queue.get
+        monotonic = time.monotonic
+        poll_key = cv2.pollKey
+        while not stopped():
+            try:
+                packet = next_packet(timeout=_QUEUE_POLL_S)
+            except queue.Empty:
+                pass
+            else:
+                now = monotonic()
+                if now - last_shown.get(packet.cam_name, 0.0) >= min_interval:
+                    show(packet.cam_name, packet.frame)
+                    last_shown[packet.cam_name] = now
+            if publisher is not None:
+                if publisher.stop_requested():
+                    logger.info("Stop requested by the viewer — stopping pipeline.")
+                    break
+            elif windowed and poll_key() == _QUIT_KEY:
+                logger.info("'q' pressed — stopping pipeline.")
+                break
 
-            self._poll_gyro()
+    def _build_show(
+        self, titles: dict[str, str]
+    ) -> Callable[[str, NDArray[np.uint8]], None]:
+        """Return the function the display loop shows each frame with.
 
-            if not any_frame:
-                time.sleep(_IDLE_SLEEP_S)
-                continue
+        With ``shared_memory_view`` frames are published to shared memory
+        for ``view_shared_frames.py`` rather than drawn in-process, falling
+        back to windows if shared memory is unavailable. Otherwise each
+        camera gets an OpenCV window.
 
-            if self.live_view_enabled and cv2.waitKey(1) == _QUIT_KEY:
-                logger.info("'q' pressed — stopping pipeline.")
-                break
+        Parameters
+        ----------
+        titles : dict[str, str]
+            Window title per colour camera.
+
+        Returns
+        -------
+        Callable[[str, NDArray[np.uint8]], None]
+            Takes a camera name and the frame to show for it.
+        """
+        if self.live_view_enabled and self._settings.shared_memory_view:
+            width, height = self._settings.colour_camera_resolution
+            try:
+                self._frame_publisher = SharedFramePublisher(
+                    self._colour_camera_names, (height, width, 3)
+                )
+            except OSError as exc:
+                logger.warning(
+                    f"Shared memory live view unavailable ({exc}); "
+                    "using OpenCV windows."
+                )
+            else:
+                return self._frame_publisher.publish
+
+        imshow = cv2.imshow
+
+        def show(cam_name: str, frame: NDArray[np.uint8]) -> None:
+            imshow(titles[cam_name], frame)
+
+        return show
+
+    # ------------------------------------------------------------------ #
+    # Pipeline stages                                                      #
+    # ------------------------------------------------------------------ #
+
+    def _capture_loop(self) -> None:
+        """Read frames from every camera and hand them to the next stage.
+
+        Colour frames go to the inference stage (with the latest depth
+        frame) when a detector exists; all other frames are emitted
+        directly. Gyro readings are flushed from this thread too. Frames
+        that queued up on the host are read together, so a whole batch can
+        reach the inference stage in one pass.
+        """
+        if self._settings.realtime:
+            self._pin_current_thread(
+                self._settings.capture_cpus, fifo_priority=_CAPTURE_FIFO_PRIORITY
+            )
+        # Bound once: this loop runs for every frame from every camera. The
+        # camera list is fixed once the device has started.
+        cam_names = self._camera.get_camera_names()
+        max_frames = self._settings.inference_batch_size if self.batching_enabled else 1
+        stopped = self._stop_event.is_set
+        get_frames = self._camera.get_frames
+        dispatch = self._dispatch_frame
+        poll_gyro = self._poll_gyro
+        wait_for_data = self._camera.wait_for_data
+        try:
+            while not stopped():
+                any_frame = False
+                for cam_name in cam_names:
+                    for frame, timestamp_s in get_frames(cam_name, max_frames):
+                        dispatch(cam_name, frame, timestamp_s)
+                        any_frame = True
+
+                poll_gyro()
+
+                if not any_frame:
+                    # Park until DepthAI delivers the next packet rather than
+                    # spinning on the non-blocking queues.
+                    wait_for_data(_QUEUE_POLL_S)
+        except Exception:
+            logger.exception("Capture stage failed — stopping pipeline.")
+            self._stop_event.set()
+
+    def _infer_loop(self) -> None:
+        """Run the detector over queued colour frames and emit annotated frames.
+
+        Frames are collected into batches of ``inference_batch_size`` when
+        batching is enabled; a partial batch is flushed after
+        ``_BATCH_TIMEOUT_S``. Exits once capture has stopped and the queue
+        is drained.
+        """
+        if self._settings.realtime:
+            self._pin_current_thread(self._settings.inference_cpus)
+        batch_size = self._settings.inference_batch_size if self.batching_enabled else 1
+        process = (
+            self._track_and_emit
+            if self.async_detection_enabled
+            else self._detect_and_emit
+        )
+        pending: list[_FramePacket] = []
+        deadline = 0.0
+        try:
+            while True:
+                timeout = (
+                    max(0.0, deadline - time.monotonic()) if pending else _QUEUE_POLL_S
+                )
+                try:
+                    packet = self._infer_queue.get(timeout=timeout)
+                except queue.Empty:
+                    if pending:
+                        process(pending)
+                        pending = []
+                    elif self._upstream_done(self._capture_thread):
+                        break
+                    continue
+                if not pending:
+                    deadline = time.monotonic() + _BATCH_TIMEOUT_S
+                pending.append(packet)
+                if len(pending) >= batch_size:
+                    process(pending)
+                    pending = []
+        except Exception:
+            logger.exception("Inference stage failed — stopping pipeline.")
+            self._stop_event.set()
+
+    def _detect_loop(self) -> None:
+        """Detector worker: run the detector on the newest frame offered to it.
+
+        Each result is published per camera for the inference stage to pick
+        up. Exits once the inference stage has stopped.
+        """
+        assert self._detector is not None
+        if self._settings.realtime:
+            self._pin_current_thread(self._settings.inference_cpus)
+        try:
+            while True:
+                try:
+                    packet = self._detect_slot.get(timeout=_QUEUE_POLL_S)
+                except queue.Empty:
+                    if self._upstream_done(self._infer_thread):
+                        break
+                    continue
+                # Same input choice as _detect_and_emit(), one frame at a time.
+                # The input is the worker's own copy (_detach_for_detector());
+                # packet.frame only gives the size to map boxes onto.
+                source: NDArray[np.uint8] | DeviceFrame = packet.frame
+                if packet.device_frame is not None:
+                    source = packet.device_frame
+                elif packet.inference_frame is not None:
+                    source = packet.inference_frame
+                results = self._detector.run(source, output_frame=packet.frame)
+                if results is not None:
+                    self._latest_detections[packet.cam_name] = (
+                        results,
+                        packet.frame_index,
+                    )
+        except Exception:
+            logger.exception("Detector stage failed — stopping pipeline.")
+            self._stop_event.set()
+
+    @staticmethod
+    def _pin_current_thread(
+        cpus: frozenset[int], fifo_priority: int | None = None
+    ) -> None:
+        """Pin the calling thread to *cpus* and optionally make it SCHED_FIFO.
+
+        Best effort: unsupported platforms, cores outside the process's
+        allowed set, and missing privileges (SCHED_FIFO needs CAP_SYS_NICE)
+        are logged and skipped.
+        Threads started from the calling thread inherit its affinity, but
+        not the realtime policy.
+
+        Parameters
+        ----------
+        cpus : frozenset[int]
+            Cores to run on, as validated by ``Settings``.
+        fifo_priority : int | None
+            SCHED_FIFO priority to request, or None to leave scheduling as is.
+        """
+        if not hasattr(os, "sched_setaffinity"):
+            logger.warning("realtime is only supported on Linux; ignoring.")
+            return
+        name = threading.current_thread().name
+        try:
+            os.sched_setaffinity(0, cpus)
+        except OSError:
+            logger.warning(f"CPU(s) {sorted(cpus)} unavailable; '{name}' not pinned.")
+        else:
+            logger.info(f"Pinned '{name}' thread to CPU(s) {sorted(cpus)}.")
+        if fifo_priority is None:
+            return
+        try:
+            os.sched_setscheduler(
+                0,
+                os.SCHED_FIFO | os.SCHED_RESET_ON_FORK,
+                os.sched_param(fifo_priority),
+            )
+        except PermissionError:
+            logger.warning(
+                f"No permission for SCHED_FIFO on '{name}' thread "
+                "(needs root or CAP_SYS_NICE); using default scheduling."
+            )
+        else:
+            logger.info(f"'{name}' thread running at SCHED_FIFO {fifo_priority}.")
+
+    @contextlib.contextmanager
+    def _default_affinity(self) -> Iterator[None]:
+        """Run the block with the process's original CPU affinity.
+
+        Writer threads started inside it inherit that affinity instead of
+        the pinned one of the stage thread starting them, so they stay off
+        the capture core.
+        """
+        if self._default_cpus is None:
+            yield
+            return
+        pinned = os.sched_getaffinity(0)
+        os.sched_setaffinity(0, self._default_cpus)
+        try:
+            yield
+        finally:
+            os.sched_setaffinity(0, pinned)
+
+    @staticmethod
+    def _upstream_done(*threads: threading.Thread | None) -> bool:
+        """Return True if none of *threads* is still running."""
+        return all(t is None or not t.is_alive() for t in threads)
 
     # ------------------------------------------------------------------ #
     # Per-frame processing                                                 #
     # ------------------------------------------------------------------ #
 
-    def _process_frame(self, cam_name: str, frame: NDArray[np.uint8]) -> None:
-        """Record, annotate, and optionally display one frame from a single camera.
+    def _dispatch_frame(
+        self, cam_name: str, frame: NDArray[np.uint8], timestamp_s: float
+    ) -> None:
+        """Route a captured frame to inference or straight to the output stages.
+
+        The depth frame and device-scaled inference frame are captured now
+        so that they are the ones closest in time to the colour frame. Frames
+        due for detection start their GPU upload here, overlapping the
+        inference of earlier frames.
 
         Parameters
         ----------
         cam_name : str
             Camera identifier (e.g. ``"CAM_A"``).
         frame : NDArray[np.uint8]
-            Raw BGR frame from the camera.
+            Raw BGR or grayscale frame from the camera.
+        timestamp_s : float
+            Capture time of *frame* on the device clock, in seconds.
         """
-        self._lazy_start_recorder(cam_name, frame)
         self._lazy_start_gyro(cam_name)
 
-        display_frame = (
-            self._apply_inference(frame)
-            if cam_name in self._colour_camera_names
-            else frame
+        if cam_name in self._colour_camera_names and self._detector is not None:
+            depth_frame = (
+                self._camera.get_depth_frame() if self._estimator is not None else None
+            )
+            inference_frame = self._camera.get_inference_frame(cam_name)
+            resolution = self._settings.inference_resolution
+            if inference_frame is None and resolution is not None:
+                # Scaled frame not ready yet: downsize on the host so detector
+                # input (and hence tracking coordinates) stays at one scale.
+                inference_frame = cv2.resize(  # type: ignore[assignment]
+                    frame, resolution, interpolation=cv2.INTER_AREA
+                )
+            detect = self._due_for_detection(cam_name)
+            frame_index = self._frames_captured.get(cam_name, 0)
+            self._frames_captured[cam_name] = frame_index + 1
+            device_frame = (
+                self._detector.upload(inference_frame)
+                if detect and inference_frame is not None
+                else None
+            )
+            self._offer(
+                self._infer_queue,
+                _FramePacket(
+                    cam_name,
+                    frame,
+                    depth_frame,
+                    inference_frame,
+                    device_frame,
+                    detect,
+                    frame_index,
+                    timestamp_s,
+                ),
+            )
+        else:
+            self._emit_frame(
+                _FramePacket(cam_name, frame, None, timestamp_s=timestamp_s)
+            )
+
+    def _emit_frame(
+        self,
+        packet: _FramePacket,
+        annotated: NDArray[np.uint8] | None = None,
+        estimates: list[DetectionEstimate] | None = None,
+    ) -> None:
+        """Hand a processed frame to its recorder and, if enabled, display.
+
+        Dispatches to the camera's output step from ``_build_emitter()``.
+
+        Parameters
+        ----------
+        packet : _FramePacket
+            Raw frame from the camera.
+        annotated : NDArray[np.uint8] | None
+            Copy of the frame with detections drawn, if annotation ran. It is
+            displayed, and recorded when ``annotate_recording`` is set.
+        estimates : list[DetectionEstimate] | None
+            Detections for the frame, written to the camera's detection
+            sidecar (if any) in step with the recorded frame.
+        """
+        self._emitters[packet.cam_name](packet, annotated, estimates)
+
+    @staticmethod
+    def _offer(target: queue.Queue[_FramePacket], packet: _FramePacket) -> None:
+        """Put *packet* on *target* without blocking, dropping it if full."""
+        with contextlib.suppress(queue.Full):
+            target.put_nowait(packet)
+
+    def _detect_and_emit(self, packets: list[_FramePacket]) -> None:
+        """Run the detector over *packets* and emit them in capture order.
+
+        Only every ``detection_stride``-th frame per camera goes to the
+        detector; boxes for the frames in between are extrapolated from the
+        camera's recent detections.
+
+        Parameters
+        ----------
+        packets : list[_FramePacket]
+            Colour frames to run inference on, oldest first.
+        """
+        if self._detector is None:
+            return
+        to_detect = [p for p in packets if p.detect]
+        # Detect on the small device-scaled frame where available (already
+        # uploaded, if async upload is on); results are mapped back onto the
+        # full-size frame for drawing and depth.
+        uploaded = [p.device_frame for p in to_detect]
+        inputs: list[NDArray[np.uint8]] | list[DeviceFrame] = (
+            [f for f in uploaded if f is not None]
+            if all(f is not None for f in uploaded)
+            else [
+                p.frame if p.inference_frame is None else p.inference_frame
+                for p in to_detect
+            ]
         )
+        detected = iter(
+            self._detector.run_batch(inputs, output_frames=[p.frame for p in to_detect])
+        )
+        detections = 0
+        for packet in packets:
+            propagator = self._propagators.setdefault(packet.cam_name, BoxPropagator())
+            if packet.detect:
+                results = next(detected)
+                if results is not None:
+                    propagator.update(results, packet.frame_index)
+                    detections += 0 if results.boxes is None else len(results.boxes)
+            else:
+                results = propagator.predict(packet.frame, packet.frame_index)
+            self._emit_results(packet, results)
+        self._record_stats(len(packets), len(to_detect), detections)
 
-        if cam_name in self._recorders:
-            self._recorders[cam_name].write(display_frame)
+    def _track_and_emit(self, packets: list[_FramePacket]) -> None:
+        """Emit *packets* at once using the detector worker's latest boxes.
 
-        if self.live_view_enabled and cam_name in self._colour_camera_names:
-            cv2.imshow(f"OAK-D Feed - {cam_name}", display_frame)
+        Frames due for detection are handed to the worker, replacing any it
+        has not started on. Every frame is emitted without waiting, with the
+        camera's newest published detection extrapolated onto it, so display
+        and recording run at the capture rate rather than the detector's.
 
-    def _apply_inference(self, frame: NDArray[np.uint8]) -> NDArray[np.uint8]:
-        """Run object detection and draw annotations if inference is enabled.
+        Parameters
+        ----------
+        packets : list[_FramePacket]
+            Colour frames, oldest first.
+        """
+        detector_frames = detections = 0
+        for packet in packets:
+            if packet.detect:
+                self._offer(self._detect_slot, self._detach_for_detector(packet))
+            propagator = self._propagators.setdefault(packet.cam_name, BoxPropagator())
+            published = self._latest_detections.pop(packet.cam_name, None)
+            if published is not None:
+                results, frame_index = published
+                propagator.update(results, frame_index)
+                detector_frames += 1
+                detections += 0 if results.boxes is None else len(results.boxes)
+            self._emit_results(
+                packet, propagator.predict(packet.frame, packet.frame_index)
+            )
+        self._record_stats(len(packets), detector_frames, detections)
+
+    def _detach_for_detector(self, packet: _FramePacket) -> _FramePacket:
+        """Empty the detector slot and copy *packet*'s detector input for it.
+
+        The copy goes into whichever of the two detector buffers the worker
+        is not using: the one just taken back out of the slot, or else the
+        other one, since the worker has taken the last frame offered.
+        Uploaded frames need no copy.
+
+        Parameters
+        ----------
+        packet : _FramePacket
+            Frame due for detection.
+
+        Returns
+        -------
+        _FramePacket
+            *packet* with ``inference_frame`` set to the copy.
+        """
+        try:
+            self._detect_slot.get_nowait()
+        except queue.Empty:
+            self._detect_buffer ^= 1
+        if packet.device_frame is not None:
+            return packet
+        source = (
+            packet.frame if packet.inference_frame is None else packet.inference_frame
+        )
+        buffer = self._detect_buffers[self._detect_buffer]
+        if buffer is None or buffer.shape != source.shape:
+            buffer = np.empty_like(source)
+            self._detect_buffers[self._detect_buffer] = buffer
+        np.copyto(buffer, source)
+        return packet._replace(inference_frame=buffer)
+
+    def _emit_results(self, packet: _FramePacket, results: Results | None) -> None:
+        """Estimate, annotate, and emit a colour frame with its detections.
+
+        Parameters
+        ----------
+        packet : _FramePacket
+            Colour frame from the inference queue.
+        results : Results | None
+            Detections for the frame, or None to emit it as-is.
+        """
+        if results is None:
+            self._emit_frame(packet)
+            return
+        # Decoded once here for both the estimator and the tracker.
+        detections = detection_array(results)
+        estimates = self._estimate(packet.frame, detections, packet.depth_frame)
+        # Nothing to draw on an empty frame (most of them, on open water):
+        # emit the raw frame rather than an identical annotated copy.
+        annotated = (
+            self._annotate(packet, detections, results.names, estimates)
+            if self.annotation_enabled and len(detections)
+            else None
+        )
+        self._emit_frame(packet, annotated, estimates)
+
+    def _record_stats(self, frames: int, detector_frames: int, detections: int) -> None:
+        """Accumulate inference counts and log a summary once per interval.
+
+        Parameters
+        ----------
+        frames : int
+            Colour frames processed (detected or extrapolated).
+        detector_frames : int
+            Frames of those that went through the detector.
+        detections : int
+            Boxes returned by the detector for those frames.
+        """
+        self._stats_frames += frames
+        self._stats_detector_frames += detector_frames
+        self._stats_detections += detections
+        now = time.monotonic()
+        elapsed = now - self._stats_since
+        if elapsed < _STATS_INTERVAL_S:
+            return
+        logger.debug(
+            f"Inference: {self._stats_frames / elapsed:.1f} FPS, "
+            f"{self._stats_detector_frames} detector frame(s), "
+            f"{self._stats_detections} detection(s) in the last {elapsed:.1f}s"
+        )
+        self._stats_frames = self._stats_detector_frames = self._stats_detections = 0
+        self._stats_since = now
+
+    def _due_for_detection(self, cam_name: str) -> bool:
+        """Return True if *cam_name*'s next frame should go to the detector.
+
+        Parameters
+        ----------
+        cam_name : str
+            Camera the frame came from.
+        """
+        remaining = self._frames_until_detection.get(cam_name, 0)
+        if remaining == 0:
+            self._frames_until_detection[cam_name] = self._settings.detection_stride - 1
+            return True
+        self._frames_until_detection[cam_name] = remaining - 1
+        return False
+
+    def _estimate(
+        self,
+        frame: NDArray[np.uint8],
+        detections: NDArray[np.float32],
+        depth_frame: NDArray[np.uint16] | None,
+    ) -> list[DetectionEstimate]:
+        """Estimate distance and bearing for each detection on a frame.
 
         Parameters
         ----------
         frame : NDArray[np.uint8]
-            Raw BGR frame.
+            Raw BGR frame the detections were produced from.
+        detections : NDArray[np.float32]
+            Dense detections for *frame* from ``detection_array()``.
+        depth_frame : NDArray[np.uint16] | None
+            Depth frame captured alongside *frame*, or None if unavailable,
+            in which case distances are None.
 
         Returns
         -------
-        NDArray[np.uint8]
-            Annotated frame, or the original frame if inference is disabled.
+        list[DetectionEstimate]
+            One estimate per detection, or empty if no estimator exists.
         """
-        if self._detector is None:
-            return frame
-        results = self._detector.run(frame)
-        if results is None or self._tracker is None:
-            return frame
-        depth_frame = self._camera.get_depth_frame()
-        estimates = (
-            self._estimator.estimate(depth_frame, results, frame.shape[1])
-            if self._estimator is not None and depth_frame is not None
-            else []
+        if self._estimator is None:
+            return []
+        return self._estimator.estimate(depth_frame, detections, frame.shape[1])
+
+    def _annotate(
+        self,
+        packet: _FramePacket,
+        detections: NDArray[np.float32],
+        names: dict[int, str],
+        estimates: list[DetectionEstimate],
+    ) -> NDArray[np.uint8] | None:
+        """Draw detections and depth labels onto a copy of a frame.
+
+        Parameters
+        ----------
+        packet : _FramePacket
+            Colour frame the detections were produced from.
+        detections : NDArray[np.float32]
+            Dense detections for the frame from ``detection_array()``.
+        names : dict[int, str]
+            Class names by class ID, from the YOLO results.
+        estimates : list[DetectionEstimate]
+            Depth estimates for *detections*, from ``_estimate()``.
+
+        Returns
+        -------
+        NDArray[np.uint8] | None
+            Annotated frame, or None if no tracker exists.
+        """
+        if self._tracker is None:
+            return None
+        return self._tracker.draw_detections(
+            packet.frame, detections, names, estimates, cam_name=packet.cam_name
         )
-        return self._tracker.draw_detections(frame, results, estimates)
 
     def _poll_gyro(self) -> None:
         """Drain the IMU queue and flush any new readings to disk."""
         if self._gyro_recorder is None or not self._gyro_started:
             return
         readings = self._camera.get_gyro_data()
-        if readings:
+        if readings is not None:
             self._gyro_recorder.write(readings)
 
     # ------------------------------------------------------------------ #
@@ -275,17 +1109,21 @@ class Pipeline:
 
         height, width = frame.shape[:2]
         is_colour = self._camera.is_colour_camera(frame)
-        recorder.start(
-            frame_width=width,
-            frame_height=height,
-            fps=_FPS,
-            is_colour=is_colour,
-            timestamp=self._session_timestamp,
-        )
+        with self._default_affinity():
+            recorder.start(
+                frame_width=width,
+                frame_height=height,
+                fps=_FPS,
+                is_colour=is_colour,
+                timestamp=self._session_timestamp,
+            )
+            detection_recorder = self._detection_recorders.get(cam_name)
+            if detection_recorder is not None:
+                detection_recorder.start(timestamp=self._session_timestamp)
         self._recording_started[cam_name] = True
 
     def _lazy_start_gyro(self, cam_name: str) -> None:
-        """Start the gyro recorder when the primary camera's recorder is ready.
+        """Start the gyro recorder when the primary camera's first frame arrives.
 
         Syncs the JSONL filename timestamp to the primary camera's video
         recording so that the two files can be aligned in post-processing.
@@ -301,7 +1139,8 @@ class Pipeline:
             or cam_name != self._primary_camera
         ):
             return
-        self._gyro_recorder.start(timestamp=self._session_timestamp)
+        with self._default_affinity():
+            self._gyro_recorder.start(timestamp=self._session_timestamp)
         self._gyro_started = True
 
     # ------------------------------------------------------------------ #
@@ -309,11 +1148,22 @@ class Pipeline:
     # ------------------------------------------------------------------ #
 
     def _shutdown(self) -> None:
-        """Stop recording, release the camera, and destroy display windows."""
+        """Stop all stages, release the camera, and close the live view.
+
+        Stages are joined in pipeline order, then each recorder writes out
+        the frames it has queued before closing its file.
+        """
         logger.info("Shutting down pipeline (please wait for camera cleanup)...")
 
+        self._stop_event.set()
+        for thread in (self._capture_thread, self._infer_thread, self._detect_thread):
+            if thread is not None:
+                thread.join()
+
         for recorder in self._recorders.values():
             recorder.stop()
+        for detection_recorder in self._detection_recorders.values():
+            detection_recorder.stop()
         if self._gyro_recorder is not None:
             self._gyro_recorder.stop()
 
@@ -326,5 +1176,7 @@ class Pipeline:
         except Exception as e:
             logger.error(f"Error during camera cleanup: {e}")
 
+        if self._frame_publisher is not None:
+            self._frame_publisher.close()
         cv2.destroyAllWindows()
         logger.success("Pipeline shut down cleanly.")
@@ -2,6 +2,7 @@
 
 import os
 import sys
+from collections.abc import Mapping
 from pathlib import Path
 
 from loguru import logger
@@ -13,7 +14,9 @@ class Settings:
     """Loads and validates pipeline and model configuration.
 
     Resolves all relative paths to absolute paths anchored at the project
-    root. Validates that required files exist before the pipeline starts.
+    root (itself resolved once, so paths under it need no further
+    ``resolve()``). Validates that required files exist before the
+    pipeline starts.
 
     Parameters
     ----------
@@ -30,22 +33,90 @@ class Settings:
         camera_config_path: str | Path,
     ) -> None:
         self._root = get_project_root()
-        self.pipeline_config: dict[str, object] = load_yaml(pipeline_config_path)
-        self.model_config: dict[str, object] = load_yaml(model_config_path)
-        self.camera_config: dict[str, object] = load_yaml(camera_config_path)
+        self.pipeline_config: Mapping[str, object] = load_yaml(pipeline_config_path)
+        self.model_config: Mapping[str, object] = load_yaml(model_config_path)
+        self.camera_config: Mapping[str, object] = load_yaml(camera_config_path)
+        # Values are read once here rather than on every access: several
+        # are consulted per frame.
+        pipeline = self.pipeline_config
+        # Whether to run YOLO inference on each frame.
+        self.inference_enabled: bool = bool(pipeline.get("inference_enabled", False))
+        # Whether to record the camera feed to disk.
+        self.recording_enabled: bool = bool(pipeline.get("recording_enabled", False))
+        # Whether to display the camera feed in real-time.
+        self.live_view_enabled: bool = bool(pipeline.get("live_view_enabled", True))
+        # Highest rate live view windows are redrawn at; 0 means every frame.
+        self.display_max_fps: float = float(pipeline.get("display_max_fps", 0))  # type: ignore[arg-type]
+        # Whether live view is shared with view_shared_frames.py rather than
+        # shown in OpenCV windows by the pipeline itself.
+        self.shared_memory_view: bool = bool(pipeline.get("shared_memory_view", False))
+        # Whether recordings show drawn detections rather than raw frames.
+        self.annotate_recording: bool = bool(pipeline.get("annotate_recording", True))
+        # Whether to capture gyroscope data from the IMU.
+        self.record_gyroscope: bool = bool(pipeline.get("record_gyroscope", False))
+        # Number of frames grouped into one detector call when running headless.
+        self.inference_batch_size: int = int(pipeline.get("inference_batch_size", 1))  # type: ignore[call-overload]
+        # Run the detector on one in every this many frames per camera.
+        self.detection_stride: int = int(pipeline.get("detection_stride", 1))  # type: ignore[call-overload]
+        # Whether the detector runs on its own thread, decoupled from display.
+        self.async_detection: bool = bool(pipeline.get("async_detection", False))
+        # Whether to pin pipeline threads to CPUs and run capture at SCHED_FIFO.
+        self.realtime: bool = bool(pipeline.get("realtime", False))
+        # CPUs the display, capture, and inference threads are pinned to when
+        # realtime is on.
+        self.main_cpus: frozenset[int] = self._resolve_cpus("main_cpus")
+        self.capture_cpus: frozenset[int] = self._resolve_cpus("capture_cpus")
+        self.inference_cpus: frozenset[int] = self._resolve_cpus("inference_cpus")
+        # Target runtime environment: 'dev' or 'pi'.
+        self.dev_or_pi: str = str(pipeline.get("dev_or_pi", "dev"))
+        # Output (width, height) for colour cameras (e.g. CAM_A).
+        self.colour_camera_resolution: tuple[int, int] = self._resolve_resolution(
+            "colour_camera_resolution", (1920, 1080)
+        )
+        # Output (width, height) for mono cameras (e.g. CAM_B, CAM_C).
+        self.mono_camera_resolution: tuple[int, int] = self._resolve_resolution(
+            "mono_camera_resolution", (640, 400)
+        )
+        # Device-scaled detector input (width, height), or None to use full
+        # frames.
+        self.inference_resolution: tuple[int, int] | None = (
+            self._resolve_resolution("inference_resolution", (0, 0))
+            if self.camera_config.get("inference_resolution")
+            else None
+        )
         self.output_dir: Path = self._resolve_output_dir()
         self.model_path: Path = self._resolve_model_path()
+        self.calibration_data_path: Path | None = self._resolve_calibration_path()
         self._validate()
 
+    def _resolve_resolution(
+        self, key: str, default: tuple[int, int]
+    ) -> tuple[int, int]:
+        """Read a ``[width, height]`` camera config entry as a tuple."""
+        resolution: list[int] = self.camera_config.get(key) or list(default)  # type: ignore[assignment]
+        w, h = resolution[0], resolution[1]
+        return int(w), int(h)
+
+    def _resolve_cpus(self, key: str) -> frozenset[int]:
+        """Read a list of CPU IDs from the pipeline config as a set."""
+        cpus: list[int] = self.pipeline_config.get(key) or []  # type: ignore[assignment]
+        return frozenset(int(cpu) for cpu in cpus)
+
     def _resolve_output_dir(self) -> Path:
         raw = str(
             self.pipeline_config.get("camera_feed_output_dir", "output/recordings/")
         )
-        return (self._root / raw).resolve()
+        return self._root / raw
 
     def _resolve_model_path(self) -> Path:
         model_filename = str(self.model_config.get("model", ""))
-        return (self._root / "models" / model_filename).resolve()
+        return self._root / "models" / model_filename
+
+    def _resolve_calibration_path(self) -> Path | None:
+        raw = self.model_config.get("int8_calibration_data")
+        if not raw:
+            return None
+        return self._root / str(raw)
 
     def _has_display(self) -> bool:
         """Return True if a display server is available for GUI output."""
@@ -57,6 +128,16 @@ class Settings:
         if self.inference_enabled and not self.model_path.exists():
             logger.error(f"Model file not found: {self.model_path}")
             raise FileNotFoundError(f"Model file not found: {self.model_path}")
+        if (
+            self.calibration_data_path is not None
+            and not self.calibration_data_path.exists()
+        ):
+            logger.error(
+                f"INT8 calibration data not found: {self.calibration_data_path}"
+            )
+            raise FileNotFoundError(
+                f"INT8 calibration data not found: {self.calibration_data_path}"
+            )
         if self.live_view_enabled and not self._has_display():
             logger.error(
                 "live_view_enabled is True but no display detected. "
@@ -65,47 +146,72 @@ class Settings:
             raise OSError(
                 "No display detected. Set 'live_view_enabled: False' in pipeline_config.yaml."
             )
+        if self.inference_batch_size < 1:
+            logger.error(
+                f"inference_batch_size must be >= 1, got {self.inference_batch_size}"
+            )
+            raise ValueError(
+                f"inference_batch_size must be >= 1, got {self.inference_batch_size}"
+            )
+        if self.detection_stride < 1:
+            logger.error(f"detection_stride must be >= 1, got {self.detection_stride}")
+            raise ValueError(
+                f"detection_stride must be >= 1, got {self.detection_stride}"
+            )
+        if self.display_max_fps < 0:
+            logger.error(f"display_max_fps must be >= 0, got {self.display_max_fps}")
+            raise ValueError(
+                f"display_max_fps must be >= 0, got {self.display_max_fps}"
+            )
+        if self.inference_enabled:
+            self._validate_upload_size()
+        if self.realtime:
+            self._validate_cpus()
         logger.debug(f"Settings validated. Project root: {self._root}")
 
-    @property
-    def inference_enabled(self) -> bool:
-        """Whether to run YOLO inference on each frame."""
-        return bool(self.pipeline_config.get("inference_enabled", False))
-
-    @property
-    def recording_enabled(self) -> bool:
-        """Whether to record the camera feed to disk."""
-        return bool(self.pipeline_config.get("recording_enabled", False))
-
-    @property
-    def live_view_enabled(self) -> bool:
-        """Whether to display the camera feed in real-time."""
-        return bool(self.pipeline_config.get("live_view_enabled", True))
-
-    @property
-    def record_gyroscope(self) -> bool:
-        """Whether to capture gyroscope data from the IMU."""
-        return bool(self.pipeline_config.get("record_gyroscope", False))
-
-    @property
-    def dev_or_pi(self) -> str:
-        """Target runtime environment: 'dev' or 'pi'."""
-        return str(self.pipeline_config.get("dev_or_pi", "dev"))
-
-    @property
-    def colour_camera_resolution(self) -> tuple[int, int]:
-        """Output resolution for colour cameras (e.g. CAM_A)."""
-        resolution: list[int] = self.camera_config.get(
-            "colour_camera_resolution", [1920, 1080]
-        )  # type: ignore[assignment]
-        w, h = resolution[0], resolution[1]
-        return int(w), int(h)
+    def _validate_upload_size(self) -> None:
+        """Check that uploaded detector frames fit the model's input size.
+
+        With ``async_upload`` frames reach the GPU at ``inference_resolution``
+        and skip Ultralytics' resize to ``imgsz``, so a larger frame would
+        exceed the engine's maximum input shape.
+        """
+        if (
+            not self.model_config.get("async_upload")
+            or self.inference_resolution is None
+        ):
+            return
+        imgsz = int(self.model_config.get("imgsz", 640))  # type: ignore[call-overload]
+        if max(self.inference_resolution) > imgsz:
+            logger.error(
+                f"inference_resolution {list(self.inference_resolution)} exceeds "
+                f"imgsz {imgsz}; reduce it or turn off async_upload."
+            )
+            raise ValueError(
+                f"inference_resolution {list(self.inference_resolution)} exceeds "
+                f"imgsz {imgsz}; reduce it or turn off async_upload."
+            )
 
-    @property
-    def mono_camera_resolution(self) -> tuple[int, int]:
-        """Output resolution for mono cameras (e.g. CAM_B, CAM_C)."""
-        resolution: list[int] = self.camera_config.get(
-            "mono_camera_resolution", [640, 400]
-        )  # type: ignore[assignment]
-        w, h = resolution[0], resolution[1]
-        return int(w), int(h)
+    def _validate_cpus(self) -> None:
+        """Check that each realtime CPU set is non-empty and exists on this machine."""
+        cpu_count = os.cpu_count() or 1
+        for key, cpus in (
+            ("main_cpus", self.main_cpus),
+            ("capture_cpus", self.capture_cpus),
+            ("inference_cpus", self.inference_cpus),
+        ):
+            if not cpus:
+                logger.error(f"{key} must list at least one CPU when realtime is on.")
+                raise ValueError(
+                    f"{key} must list at least one CPU when realtime is on."
+                )
+            missing = sorted(cpu for cpu in cpus if not 0 <= cpu < cpu_count)
+            if missing:
+                logger.error(
+                    f"{key} lists CPU(s) {missing}, but this machine has CPUs "
+                    f"0-{cpu_count - 1}."
+                )
+                raise ValueError(
+                    f"{key} lists CPU(s) {missing}, but this machine has CPUs "
+                    f"0-{cpu_count - 1}."
+                )
@@ -1,24 +1,48 @@
 """Config loading utilities for oakd-camera-tracking."""
 
+import functools
+import json
+from collections.abc import Mapping
 from pathlib import Path
+from types import MappingProxyType
 
 import yaml
 from loguru import logger
 
+try:
+    # libyaml-backed loader; much faster than the pure-Python SafeLoader.
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader  # type: ignore[assignment]
 
+# Parsed configs are also written beside the YAML as ``<name>.yaml.json``,
+# which is much faster to load on a cold start than re-parsing the YAML.
+# The sidecar records the YAML's mtime and size and is only used on an exact
+# match, so an edit, copy, or checkout that changes either re-parses it.
+_JSON_CACHE_SUFFIX = ".json"
+
+
+@functools.lru_cache(maxsize=1)
 def get_project_root() -> Path:
     """Return the absolute path to the oakd-camera-tracking project root.
 
     This file lives at src/utils/config_utils.py, so the project root is
-    three levels up from this file.
+    three levels up from this file. The root cannot move while the process
+    runs, so it is resolved once and cached.
     """
     if __file__ is None:
         raise RuntimeError("__file__ is not available in this context")
     return Path(__file__).resolve().parent.parent.parent
 
 
-def load_yaml(path: str | Path) -> dict[str, object]:
-    """Load a YAML file and return its contents as a dictionary.
+def load_yaml(path: str | Path) -> Mapping[str, object]:
+    """Load a YAML file and return its contents as a read-only mapping.
+
+    Parsed contents are cached in-process and in a JSON file next to the
+    YAML, both keyed on the file's modification time and size, so an edited
+    file is always re-parsed. The cached dictionary is shared between
+    callers, so it is returned behind a read-only view; nested values must
+    not be mutated either.
 
     Parameters
     ----------
@@ -30,14 +54,73 @@ def load_yaml(path: str | Path) -> dict[str, object]:
     FileNotFoundError
         If the file does not exist at the given path.
     """
-    resolved = Path(path).resolve()
-    if not resolved.exists():
-        logger.error(f"Config file not found: {resolved}")
-        raise FileNotFoundError(f"Config file not found: {resolved}")
-    with resolved.open("r") as f:
-        data = yaml.safe_load(f)
+    # absolute() rather than resolve(): the cache key only needs to be
+    # stable, and resolving symlinks costs a syscall per path component.
+    absolute = Path(path).absolute()
+    # One stat both checks the file exists and supplies the cache key.
+    try:
+        stat = absolute.stat()
+    except FileNotFoundError as exc:
+        logger.error(f"Config file not found: {absolute}")
+        raise FileNotFoundError(f"Config file not found: {absolute}") from exc
+    data = _load_yaml_cached(str(absolute), stat.st_mtime_ns, stat.st_size)
     if data is None:
-        logger.error(f"Config file is empty: {resolved}")
-        raise ValueError(f"Config file is empty: {resolved}")
-    logger.debug(f"Loaded config from {resolved}")
+        logger.error(f"Config file is empty: {absolute}")
+        raise ValueError(f"Config file is empty: {absolute}")
+    logger.debug(f"Loaded config from {absolute}")
+    return MappingProxyType(data)
+
+
+@functools.lru_cache(maxsize=16)
+def _load_yaml_cached(path: str, mtime_ns: int, size: int) -> dict[str, object] | None:
+    """Parse a YAML file, preferring its JSON cache when that is up to date.
+
+    ``mtime_ns`` and ``size`` are not used directly; they are part of the
+    cache key so that any change to the file invalidates the cached entry.
+    """
+    yaml_path = Path(path)
+    json_path = yaml_path.with_name(yaml_path.name + _JSON_CACHE_SUFFIX)
+    try:
+        with json_path.open("r") as f:
+            cached = json.load(f)
+        if (
+            isinstance(cached, dict)
+            and cached.get("mtime_ns") == mtime_ns
+            and cached.get("size") == size
+        ):
+            return cached["data"]  # type: ignore[no-any-return]
+    except (OSError, ValueError, KeyError):
+        pass  # Missing, unreadable, or corrupt cache: fall back to YAML.
+
+    with yaml_path.open("r") as f:
+        data = yaml.load(f, Loader=_YamlLoader)
+    if data is not None and _has_only_string_keys(data):
+        _write_json_cache(json_path, {"mtime_ns": mtime_ns, "size": size, "data": data})
     return data  # type: ignore[no-any-return]
+
+
+def _has_only_string_keys(data: object) -> bool:
+    """Return whether every mapping in *data* has only string keys.
+
+    JSON turns other keys (e.g. YAML integers) into strings, so such data
+    would not load back the same from the cache.
+    """
+    if isinstance(data, dict):
+        return all(
+            isinstance(key, str) and _has_only_string_keys(value)
+            for key, value in data.items()
+        )
+    if isinstance(data, list):
+        return all(_has_only_string_keys(item) for item in data)
+    return True
+
+
+def _write_json_cache(json_path: Path, cache: dict[str, object]) -> None:
+    """Best-effort write of parsed config and its YAML's stat to the cache."""
+    try:
+        with json_path.open("w") as f:
+            json.dump(cache, f)
+    except (OSError, TypeError) as exc:
+        # Read-only location or a value JSON cannot represent; skip caching.
+        logger.debug(f"Could not write config cache {json_path}: {exc}")
+        json_path.unlink(missing_ok=True)
@@ -0,0 +1,141 @@
+"""Tests for host-side frame decoding in CameraAccess."""
+
+from __future__ import annotations
+
+from datetime import timedelta
+
+import cv2
+import numpy as np
+import pytest
+
+pytest.importorskip("depthai")
+
+from src.camera.camera_access import CameraAccess  # noqa: E402
+
+_WIDTH, _HEIGHT, _STRIDE = 64, 48, 80
+
+
+class _FakeFrame:
+    """Stands in for a ``dai.ImgFrame`` holding NV12 data."""
+
+    def __init__(self, data: np.ndarray, fallback: np.ndarray) -> None:
+        self._data = data
+        self._fallback = fallback
+        self.converted_by_depthai = False
+
+    def getWidth(self) -> int:  # noqa: N802
+        return _WIDTH
+
+    def getHeight(self) -> int:  # noqa: N802
+        return _HEIGHT
+
+    def getStride(self) -> int:  # noqa: N802
+        return _STRIDE
+
+    def getData(self) -> np.ndarray:  # noqa: N802
+        return self._data
+
+    def getCvFrame(self) -> np.ndarray:  # noqa: N802
+        self.converted_by_depthai = True
+        return self._fallback
+
+
+def _nv12(plane_height: int) -> tuple[np.ndarray, np.ndarray]:
+    """Return NV12 packet data with planes of *plane_height* rows, and its BGR."""
+    rng = np.random.default_rng(0)
+    y_plane = rng.integers(0, 256, (_HEIGHT, _WIDTH), dtype=np.uint8)
+    uv_plane = rng.integers(0, 256, (_HEIGHT // 2, _WIDTH), dtype=np.uint8)
+    expected = cv2.cvtColor(np.vstack([y_plane, uv_plane]), cv2.COLOR_YUV2BGR_NV12)
+
+    data = np.zeros(_STRIDE * plane_height * 3 // 2, dtype=np.uint8)
+    y = data[: _STRIDE * plane_height].reshape(plane_height, _STRIDE)
+    uv = data[_STRIDE * plane_height :].reshape(plane_height // 2, _STRIDE)
+    y[:_HEIGHT, :_WIDTH] = y_plane
+    uv[: _HEIGHT // 2, :_WIDTH] = uv_plane
+    return data, expected
+
+
+def test_convert_nv12_reads_strided_planes_in_place() -> None:
+    """Unpadded planes with a row stride are converted without DepthAI."""
+    data, expected = _nv12(_HEIGHT)
+    frame = _FakeFrame(data, expected)
+
+    bgr = CameraAccess(record_gyroscope=False)._convert_nv12("CAM_A", frame)  # type: ignore[arg-type]
+
+    assert not frame.converted_by_depthai
+    np.testing.assert_array_equal(bgr, expected)
+
+
+def test_convert_nv12_falls_back_on_padded_planes() -> None:
+    """Planes padded below the image are left to DepthAI to convert."""
+    data, expected = _nv12(_HEIGHT + 16)
+    frame = _FakeFrame(data, expected)
+
+    bgr = CameraAccess(record_gyroscope=False)._convert_nv12("CAM_A", frame)  # type: ignore[arg-type]
+
+    assert frame.converted_by_depthai
+    np.testing.assert_array_equal(bgr, expected)
+
+
+class _FakeGrayFrame:
+    """Stands in for a ``dai.ImgFrame`` holding GRAY8 data."""
+
+    def __init__(self, value: int) -> None:
+        self._data = np.full(_WIDTH * _HEIGHT, value, dtype=np.uint8)
+
+    def getWidth(self) -> int:  # noqa: N802
+        return _WIDTH
+
+    def getHeight(self) -> int:  # noqa: N802
+        return _HEIGHT
+
+    def getStride(self) -> int:  # noqa: N802
+        return _WIDTH
+
+    def getData(self) -> np.ndarray:  # noqa: N802
+        return self._data
+
+    def getTimestamp(self) -> timedelta:  # noqa: N802
+        return timedelta(seconds=int(self._data[0]) / 10)
+
+
+class _FakeQueue:
+    """Stands in for a ``dai.MessageQueue`` holding frames waiting on the host."""
+
+    def __init__(self, frames: list[_FakeGrayFrame]) -> None:
+        self._frames = frames
+
+    def has(self) -> bool:
+        return bool(self._frames)
+
+    def get(self) -> _FakeGrayFrame:
+        return self._frames.pop(0)
+
+    def tryGetAll(self) -> list[_FakeGrayFrame]:  # noqa: N802
+        frames, self._frames = self._frames, []
+        return frames
+
+
+def test_get_frame_returns_newest_of_several_queued() -> None:
+    """With a deep queue, get_frame() skips to the newest frame."""
+    camera = CameraAccess(record_gyroscope=False, frame_queue_size=3)
+    queue = _FakeQueue([_FakeGrayFrame(value) for value in (1, 2, 3)])
+    camera._video_queues["CAM_B"] = queue  # type: ignore[assignment]
+
+    frame = camera.get_frame("CAM_B")
+
+    assert frame is not None and (frame == 3).all()
+    assert camera.get_frame("CAM_B") is None
+
+
+def test_get_frames_returns_queued_frames_oldest_first() -> None:
+    """get_frames() reads up to max_count frames, with capture times, in order."""
+    camera = CameraAccess(record_gyroscope=False, frame_buffer_count=3)
+    queue = _FakeQueue([_FakeGrayFrame(value) for value in (1, 2, 3)])
+    camera._video_queues["CAM_B"] = queue  # type: ignore[assignment]
+
+    frames = camera.get_frames("CAM_B", max_count=2)
+
+    assert [int(frame[0, 0]) for frame, _ in frames] == [1, 2]
+    assert [timestamp_s for _, timestamp_s in frames] == [0.1, 0.2]
+    assert queue.has()
@@ -0,0 +1,117 @@
+"""Tests for buffering and drop counting in CameraRecording, and its sidecar."""
+
+from __future__ import annotations
+
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+import orjson
+import pytest
+from src.camera.camera_recording import CameraRecording, DetectionRecorder
+
+
+class _GatedWriter:
+    """Stands in for a ``cv2.VideoWriter`` that encodes only while the gate is open."""
+
+    def __init__(self) -> None:
+        self.gate = threading.Event()
+        self.written: list[np.ndarray] = []
+
+    def isOpened(self) -> bool:  # noqa: N802
+        return True
+
+    def write(self, frame: np.ndarray) -> None:
+        self.gate.wait()
+        self.written.append(frame.copy())
+
+    def release(self) -> None:
+        pass
+
+
+@pytest.fixture
+def writer(monkeypatch: pytest.MonkeyPatch) -> _GatedWriter:
+    """Make every CameraRecording open a gated fake writer."""
+    fake = _GatedWriter()
+    monkeypatch.setattr(CameraRecording, "_open_writer", lambda *args, **kwargs: fake)
+    return fake
+
+
+def _start(tmp_path: Path, queue_size: int) -> CameraRecording:
+    """Return a started recorder for 48x64 colour frames."""
+    recording = CameraRecording(tmp_path, queue_size=queue_size)
+    recording.start(
+        frame_width=64, frame_height=48, fps=28, is_colour=True, timestamp="t"
+    )
+    return recording
+
+
+def _frame(value: int) -> np.ndarray:
+    """Return a 48x64 colour frame filled with *value*."""
+    return np.full((48, 64, 3), value, dtype=np.uint8)
+
+
+def test_frames_are_copied_so_callers_can_reuse_them(
+    tmp_path: Path, writer: _GatedWriter
+) -> None:
+    """A caller's buffer may be overwritten before the writer encodes it."""
+    recording = _start(tmp_path, queue_size=2)
+    frame = _frame(1)
+    assert recording.write(frame)
+    frame[:] = 9  # e.g. the camera ring wrapping onto this buffer
+
+    writer.gate.set()
+    recording.stop()
+
+    assert len(writer.written) == 1
+    assert (writer.written[0] == 1).all()
+
+
+def test_backlogged_writer_drops_and_counts_frames(
+    tmp_path: Path, writer: _GatedWriter
+) -> None:
+    """Once every pool buffer is in use, new frames are dropped and counted."""
+    recording = _start(tmp_path, queue_size=1)
+    # One buffer for the queue slot and one for the frame being encoded.
+    accepted = [recording.write(_frame(value)) for value in range(1, 5)]
+
+    assert accepted == [True, True, False, False]
+    assert recording._frames_dropped == 2
+
+    writer.gate.set()
+    recording.stop()
+
+    assert [int(frame[0, 0, 0]) for frame in writer.written] == [1, 2]
+
+
+def test_buffers_return_to_the_pool_once_written(
+    tmp_path: Path, writer: _GatedWriter
+) -> None:
+    """A writer that keeps up is never short of buffers, however many frames."""
+    writer.gate.set()
+    recording = _start(tmp_path, queue_size=1)
+    for value in range(10):
+        assert recording.write(_frame(value))
+        while len(writer.written) <= value:
+            time.sleep(0.001)  # let the writer encode it before the next
+
+    recording.stop()
+
+    assert recording._frames_dropped == 0
+    assert [int(frame[0, 0, 0]) for frame in writer.written] == list(range(10))
+
+
+def test_detection_sidecar_records_capture_time(tmp_path: Path) -> None:
+    """Sidecar lines carry the frame's capture time, not the time written."""
+    recorder = DetectionRecorder(tmp_path, file_prefix="detections")
+    recorder.start(timestamp="t")
+    recorder.write(0, 12.5, [])
+    recorder.write(1, 12.55, [])
+    recorder.stop()
+
+    lines = (tmp_path / "detections_t.jsonl").read_bytes().splitlines()
+    assert [orjson.loads(line) for line in lines] == [
+        {"frame_index": 0, "timestamp_s": 12.5, "detections": []},
+        {"frame_index": 1, "timestamp_s": 12.55, "detections": []},
+    ]
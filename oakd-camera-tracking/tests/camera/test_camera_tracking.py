@@ -0,0 +1,41 @@
+"""Tests for the annotation buffer rings in CameraTracking."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("ultralytics")
+
+from src.camera.camera_tracking import CameraTracking  # noqa: E402
+from src.inference.detections import DETECTION_COLUMNS  # noqa: E402
+
+_NO_DETECTIONS = np.empty((0, DETECTION_COLUMNS), dtype=np.float32)
+_NAMES = {0: "boat"}
+
+
+def _draw(tracking: CameraTracking, value: int, cam_name: str) -> np.ndarray:
+    """Annotate a 48x64 frame filled with *value* from *cam_name*."""
+    frame = np.full((48, 64, 3), value, dtype=np.uint8)
+    return tracking.draw_detections(frame, _NO_DETECTIONS, _NAMES, cam_name=cam_name)
+
+
+def test_ring_is_reused_after_buffer_count_frames() -> None:
+    """A camera's buffers are recycled in order once its ring is full."""
+    tracking = CameraTracking(buffer_count=2)
+    first = _draw(tracking, 1, "CAM_A")
+    second = _draw(tracking, 2, "CAM_A")
+    third = _draw(tracking, 3, "CAM_A")
+
+    assert first is third
+    assert second is not first
+
+
+def test_cameras_of_one_resolution_do_not_share_buffers() -> None:
+    """Another camera's frames cannot overwrite a camera's annotated frame."""
+    tracking = CameraTracking(buffer_count=2)
+    cam_a = _draw(tracking, 1, "CAM_A")
+    for value in range(2, 6):
+        _draw(tracking, value, "CAM_D")
+
+    assert (cam_a == 1).all()
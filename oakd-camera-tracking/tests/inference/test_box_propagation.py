@@ -0,0 +1,103 @@
+"""Tests for constant-velocity box propagation between detector runs."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("ultralytics")
+
+from src.inference.box_propagation import BoxPropagator  # noqa: E402
+from src.inference.detections import NO_TRACK_ID  # noqa: E402
+from ultralytics.engine.results import Results  # noqa: E402
+
+_FRAME = np.zeros((360, 640, 3), dtype=np.uint8)
+_NAMES = {0: "boat"}
+
+
+def _result(rows: list[list[float]]) -> Results:
+    """Return a result holding *rows* as its boxes (6 or 7 columns each)."""
+    boxes = np.array(rows, dtype=np.float32).reshape(len(rows), -1)
+    return Results(_FRAME, path="", names=_NAMES, boxes=boxes)
+
+
+def _predicted(propagator: BoxPropagator, frame_index: int) -> np.ndarray:
+    """Return the boxes *propagator* predicts for *frame_index*."""
+    predicted = propagator.predict(_FRAME, frame_index)
+    assert predicted is not None and predicted.boxes is not None
+    return np.asarray(predicted.boxes.data)
+
+
+def test_predict_before_any_detection_is_none() -> None:
+    """Nothing can be extrapolated before the first detection."""
+    assert BoxPropagator().predict(_FRAME, 0) is None
+
+
+def test_predict_extrapolates_linearly() -> None:
+    """A track's velocity between two detections carries it forward."""
+    propagator = BoxPropagator()
+    propagator.update(_result([[100, 50, 200, 150, 7, 0.9, 0]]), frame_index=0)
+    # Moved 10 px right and 4 px down over two frames.
+    propagator.update(_result([[110, 54, 210, 154, 7, 0.8, 0]]), frame_index=2)
+
+    boxes = _predicted(propagator, frame_index=5)
+
+    np.testing.assert_allclose(boxes[0, :4], [125, 60, 225, 160])
+    # Track ID, confidence and class are kept from the last detection.
+    np.testing.assert_allclose(boxes[0, 4:], [7, 0.8, 0])
+
+
+def test_predict_clips_to_frame() -> None:
+    """Extrapolated boxes stay inside the frame."""
+    propagator = BoxPropagator()
+    propagator.update(_result([[500, 50, 600, 150, 7, 0.9, 0]]), frame_index=0)
+    propagator.update(_result([[550, 50, 650, 150, 7, 0.9, 0]]), frame_index=1)
+
+    boxes = _predicted(propagator, frame_index=3)
+
+    np.testing.assert_allclose(boxes[0, :4], [640, 50, 640, 150])
+
+
+def test_new_and_unmatched_tracks_are_held_in_place() -> None:
+    """Only tracks seen in both detections move; new IDs stay put."""
+    propagator = BoxPropagator()
+    propagator.update(
+        _result([[100, 50, 200, 150, 7, 0.9, 0], [300, 50, 350, 100, 3, 0.9, 0]]),
+        frame_index=0,
+    )
+    propagator.update(
+        _result([[400, 200, 450, 250, 9, 0.9, 0], [110, 50, 210, 150, 7, 0.9, 0]]),
+        frame_index=1,
+    )
+
+    boxes = _predicted(propagator, frame_index=2)
+
+    # Track 9 is new (and track 3 gone): held where it was detected.
+    np.testing.assert_allclose(boxes[0, :4], [400, 200, 450, 250])
+    np.testing.assert_allclose(boxes[1, :4], [120, 50, 220, 150])
+
+
+def test_untracked_rows_pass_through() -> None:
+    """NO_TRACK_ID rows are not matched to each other and do not move."""
+    propagator = BoxPropagator()
+    propagator.update(
+        _result([[100, 50, 200, 150, NO_TRACK_ID, 0.9, 0]]), frame_index=0
+    )
+    propagator.update(
+        _result([[300, 50, 400, 150, NO_TRACK_ID, 0.9, 0]]), frame_index=1
+    )
+
+    boxes = _predicted(propagator, frame_index=2)
+
+    np.testing.assert_allclose(boxes[0], [300, 50, 400, 150, NO_TRACK_ID, 0.9, 0])
+
+
+def test_predict_results_pass_through() -> None:
+    """Six-column boxes from model.predict() have no track IDs and stay put."""
+    propagator = BoxPropagator()
+    propagator.update(_result([[100, 50, 200, 150, 0.9, 0]]), frame_index=0)
+    propagator.update(_result([[120, 50, 220, 150, 0.9, 0]]), frame_index=1)
+
+    boxes = _predicted(propagator, frame_index=3)
+
+    np.testing.assert_allclose(boxes[0], [120, 50, 220, 150, 0.9, 0])
@@ -0,0 +1,61 @@
+"""Tests for dense detection arrays built from YOLO results."""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+pytest.importorskip("ultralytics")
+
+from src.inference.box_propagation import BoxPropagator  # noqa: E402
+from src.inference.detections import (  # noqa: E402
+    DETECTION_COLUMNS,
+    NO_TRACK_ID,
+    TRACK_ID,
+    detection_array,
+)
+from ultralytics.engine.results import Results  # noqa: E402
+
+_FRAME = np.zeros((360, 640, 3), dtype=np.uint8)
+_NAMES = {0: "boat"}
+
+
+def _tracked_result(x_offset: float) -> Results:
+    """Return a result with one tracked box (ID 7) shifted by *x_offset*."""
+    boxes = np.array(
+        [[100 + x_offset, 50, 200 + x_offset, 150, 7, 0.9, 0]], dtype=np.float32
+    )
+    return Results(_FRAME, path="", names=_NAMES, boxes=boxes)
+
+
+def test_detection_array_on_propagated_result() -> None:
+    """Results from BoxPropagator.predict() hold ndarray boxes; both decode."""
+    propagator = BoxPropagator()
+    propagator.update(_tracked_result(0), frame_index=0)
+    propagator.update(_tracked_result(10), frame_index=1)
+    predicted = propagator.predict(_FRAME, frame_index=2)
+    assert predicted is not None
+
+    detections = detection_array(predicted)
+
+    assert detections.shape == (1, DETECTION_COLUMNS)
+    np.testing.assert_allclose(detections[0, :4], [120, 50, 220, 150])
+    assert detections[0, TRACK_ID] == 7
+
+
+def test_detection_array_inserts_track_id_for_untracked_boxes() -> None:
+    """Untracked six-column boxes gain a NO_TRACK_ID column."""
+    boxes = np.array([[10, 20, 30, 40, 0.5, 0]], dtype=np.float32)
+    result = Results(_FRAME, path="", names=_NAMES, boxes=boxes)
+
+    detections = detection_array(result)
+
+    assert detections.shape == (1, DETECTION_COLUMNS)
+    assert detections[0, TRACK_ID] == NO_TRACK_ID
+
+
+def test_detection_array_empty() -> None:
+    """A result without boxes gives an empty (0, 7) array."""
+    result = Results(_FRAME, path="", names=_NAMES)
+
+    assert detection_array(result).shape == (0, DETECTION_COLUMNS)
@@ -0,0 +1,111 @@
+"""Tests for mapping ObjectDetection results onto full-size frames."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytest.importorskip("ultralytics")
+
+import torch  # noqa: E402
+from src.inference import object_detection  # noqa: E402
+from src.inference.object_detection import DeviceFrame, ObjectDetection  # noqa: E402
+from ultralytics.engine.results import Results  # noqa: E402
+
+_NAMES = {0: "boat"}
+# 640x360 input; fused preprocessing pads it to 640x384.
+_INPUT = np.zeros((360, 640, 3), dtype=np.uint8)
+_OUTPUT = np.zeros((1080, 1920, 3), dtype=np.uint8)
+
+
+class _FakeYolo:
+    """Stands in for YOLO, returning one box that runs into the padding."""
+
+    def __init__(self, path: str) -> None:
+        self.calls: list[dict[str, object]] = []
+
+    def predict(self, source: torch.Tensor, **kwargs: object) -> list[Results]:
+        """Return a result per input, with a box down to the padded bottom edge."""
+        self.calls.append(kwargs)
+        height, width = source.shape[2:]
+        return [_padded_result(height, width) for _ in source]
+
+
+def _padded_result(height: int, width: int) -> Results:
+    """Return a result on a *height* x *width* input with a box to its bottom edge."""
+    boxes = torch.tensor([[100.0, 200.0, 300.0, float(height), 0.9, 0.0]])
+    return Results(
+        np.zeros((height, width, 3), dtype=np.uint8),
+        path="",
+        names=_NAMES,
+        boxes=boxes,
+    )
+
+
+@pytest.fixture
+def detector(monkeypatch: pytest.MonkeyPatch) -> ObjectDetection:
+    """Return a fused-preprocess detector backed by _FakeYolo."""
+    monkeypatch.setattr(object_detection, "YOLO", _FakeYolo)
+    return ObjectDetection(
+        Path("fake.pt"),
+        {
+            "imgsz": 640,
+            "fused_preprocess": True,
+            "half": True,
+            "num_threads": torch.get_num_threads(),
+        },
+    )
+
+
+def _assert_inside(result: Results | None, frame: np.ndarray) -> None:
+    """Assert every box in *result* lies within *frame*."""
+    assert result is not None
+    boxes = result.boxes.data
+    assert len(boxes) > 0
+    height, width = frame.shape[:2]
+    assert (boxes[:, :4] >= 0).all()
+    assert (boxes[:, [0, 2]] <= width).all()
+    assert (boxes[:, [1, 3]] <= height).all()
+
+
+def test_fused_run_keeps_boxes_inside_output_frame(detector: ObjectDetection) -> None:
+    """Boxes touching the blob's padding are clipped to the full-size frame."""
+    result = detector.run(_INPUT, _OUTPUT)
+
+    _assert_inside(result, _OUTPUT)
+    assert result is not None
+    np.testing.assert_allclose(result.boxes.data[0, :4], [300, 600, 900, 1080])
+
+
+def test_fused_run_batch_keeps_boxes_inside_inputs(detector: ObjectDetection) -> None:
+    """Without output frames, fused results are clipped to the input frames."""
+    results = detector.run_batch([_INPUT, _INPUT])
+
+    for result in results:
+        _assert_inside(result, _INPUT)
+
+
+def test_device_frame_boxes_stay_inside_output_frame(
+    detector: ObjectDetection,
+) -> None:
+    """Boxes from a padded upload are clipped to the frame's unpadded size."""
+    upload = DeviceFrame(
+        torch.zeros(3, 384, 640),
+        ready=None,  # type: ignore[arg-type]
+        size=_INPUT.shape[:2],
+    )
+    result = detector._rescale(
+        _padded_result(384, 640), _OUTPUT, detector._unpadded_size(upload)
+    )
+
+    _assert_inside(result, _OUTPUT)
+
+
+def test_half_is_not_passed_to_inference(detector: ObjectDetection) -> None:
+    """The half flag only sets export precision; predict() never receives it."""
+    detector.run(_INPUT)
+
+    assert detector._model.calls
+    assert all("half" not in kwargs for kwargs in detector._model.calls)
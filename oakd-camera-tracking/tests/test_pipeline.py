@@ -0,0 +1,111 @@
+"""Tests for per-frame scheduling in the pipeline's stages and its main loop."""
+
+from __future__ import annotations
+
+import threading
+from types import SimpleNamespace
+
+import cv2
+import numpy as np
+import pytest
+
+pytest.importorskip("depthai")
+pytest.importorskip("ultralytics")
+
+from src.pipeline import Pipeline, _FramePacket  # noqa: E402
+
+
+def _pipeline(**settings: object) -> Pipeline:
+    """Return a pipeline without a detector, with *settings* overridden.
+
+    Nothing here talks to a device: the camera only connects in ``run()``.
+    """
+    defaults: dict[str, object] = {
+        "inference_enabled": False,
+        "recording_enabled": False,
+        "live_view_enabled": False,
+        "record_gyroscope": False,
+        "colour_camera_resolution": (64, 48),
+        "mono_camera_resolution": (64, 48),
+        "inference_resolution": None,
+        "inference_batch_size": 1,
+        "detection_stride": 1,
+        "async_detection": False,
+        "annotate_recording": True,
+    }
+    defaults.update(settings)
+    return Pipeline(SimpleNamespace(**defaults))  # type: ignore[arg-type]
+
+
+def test_stride_one_detects_every_frame() -> None:
+    """The default stride sends every frame to the detector."""
+    pipeline = _pipeline()
+    assert all(pipeline._due_for_detection("CAM_A") for _ in range(5))
+
+
+def test_stride_detects_every_nth_frame_per_camera() -> None:
+    """Each camera detects on its first frame and then every Nth one."""
+    pipeline = _pipeline(detection_stride=3)
+    cam_a = [pipeline._due_for_detection("CAM_A") for _ in range(4)]
+    # Another camera's frames do not advance CAM_A's count.
+    cam_d = [pipeline._due_for_detection("CAM_D") for _ in range(2)]
+    cam_a += [pipeline._due_for_detection("CAM_A") for _ in range(3)]
+
+    assert cam_a == [True, False, False, True, False, False, True]
+    assert cam_d == [True, False]
+
+
+def _packet(value: int) -> _FramePacket:
+    """Return a colour frame whose detector input is filled with *value*."""
+    frame = np.zeros((48, 64, 3), dtype=np.uint8)
+    inference_frame = np.full((24, 32, 3), value, dtype=np.uint8)
+    return _FramePacket("CAM_A", frame, None, inference_frame)
+
+
+def test_detector_gets_a_copy_of_its_input() -> None:
+    """Capture may recycle its buffer; the detector's copy is unaffected."""
+    pipeline = _pipeline()
+    packet = _packet(1)
+    detached = pipeline._detach_for_detector(packet)
+    assert packet.inference_frame is not None
+    packet.inference_frame[:] = 9
+
+    assert detached.inference_frame is not packet.inference_frame
+    assert (detached.inference_frame == 1).all()
+
+
+def test_detector_buffers_alternate_only_once_the_worker_takes_one() -> None:
+    """A replaced slot frame's buffer is reused; the worker's is never touched."""
+    pipeline = _pipeline()
+    slot = pipeline._detect_slot
+
+    first = pipeline._detach_for_detector(_packet(1))
+    slot.put_nowait(first)
+    # The worker has not taken the first frame: the newer one replaces it.
+    second = pipeline._detach_for_detector(_packet(2))
+    assert second.inference_frame is first.inference_frame
+    assert slot.empty()
+
+    slot.put_nowait(second)
+    with_worker = slot.get_nowait()
+    third = pipeline._detach_for_detector(_packet(3))
+
+    assert third.inference_frame is not with_worker.inference_frame
+    assert (with_worker.inference_frame == 2).all()
+
+
+def test_main_loop_polls_keys_while_no_frames_arrive(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """'q' stops the loop even when the camera has stalled."""
+    monkeypatch.setattr(cv2, "pollKey", lambda: ord("q"))
+    pipeline = _pipeline(
+        live_view_enabled=True, shared_memory_view=False, display_max_fps=30
+    )
+    loop = threading.Thread(target=pipeline._main_loop, daemon=True)
+    loop.start()
+    loop.join(timeout=2)
+    stalled = loop.is_alive()
+    pipeline._stop_event.set()
+
+    assert not stalled
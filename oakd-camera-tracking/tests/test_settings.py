@@ -0,0 +1,95 @@
+"""Tests for validation of the pipeline, model, and camera configs."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+from src.settings import Settings
+
+
+@pytest.fixture
+def project_root(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Anchor Settings at *tmp_path*, with the model file it expects."""
+    (tmp_path / "models").mkdir()
+    (tmp_path / "models" / "unused.pt").touch()
+    monkeypatch.setattr("src.settings.get_project_root", lambda: tmp_path)
+    return tmp_path
+
+
+def _settings(
+    tmp_path: Path,
+    model: dict[str, object] | None = None,
+    camera: dict[str, object] | None = None,
+    **pipeline: object,
+) -> Settings:
+    """Return Settings for a headless, inference-free pipeline plus overrides."""
+    configs = {
+        "pipeline": {"live_view_enabled": False, "inference_enabled": False},
+        "model": {"model": "unused.pt"},
+        "camera": {"colour_camera_resolution": [1920, 1080]},
+    }
+    configs["pipeline"].update(pipeline)
+    configs["model"].update(model or {})
+    configs["camera"].update(camera or {})
+    paths = {}
+    for name, config in configs.items():
+        paths[name] = tmp_path / f"{name}_config.yaml"
+        paths[name].write_text(yaml.safe_dump(config))
+    return Settings(paths["pipeline"], paths["model"], paths["camera"])
+
+
+def test_cpu_sets_are_read_from_config(tmp_path: Path) -> None:
+    """Realtime CPU placement comes from the pipeline config."""
+    settings = _settings(
+        tmp_path, realtime=True, main_cpus=[0], capture_cpus=[0], inference_cpus=[0]
+    )
+    assert settings.main_cpus == settings.capture_cpus == frozenset({0})
+
+
+def test_cpu_beyond_machine_is_rejected(tmp_path: Path) -> None:
+    """A CPU ID this machine does not have fails validation up front."""
+    missing = os.cpu_count() or 1
+    with pytest.raises(ValueError, match="capture_cpus"):
+        _settings(
+            tmp_path,
+            realtime=True,
+            main_cpus=[0],
+            capture_cpus=[missing],
+            inference_cpus=[0],
+        )
+
+
+def test_empty_cpu_set_is_rejected(tmp_path: Path) -> None:
+    """Every stage needs somewhere to run when realtime is on."""
+    with pytest.raises(ValueError, match="inference_cpus"):
+        _settings(tmp_path, realtime=True, main_cpus=[0], capture_cpus=[0])
+
+
+def test_cpu_sets_are_ignored_without_realtime(tmp_path: Path) -> None:
+    """CPU sets for another board do not matter while realtime is off."""
+    _settings(tmp_path, capture_cpus=[(os.cpu_count() or 1) + 8])
+
+
+def test_upload_larger_than_imgsz_is_rejected(project_root: Path) -> None:
+    """Uploaded frames skip the resize to imgsz, so they must already fit it."""
+    with pytest.raises(ValueError, match="imgsz"):
+        _settings(
+            project_root,
+            model={"imgsz": 640, "async_upload": True},
+            camera={"inference_resolution": [1280, 720]},
+            inference_enabled=True,
+        )
+
+
+def test_large_inference_resolution_allowed_on_host_path(project_root: Path) -> None:
+    """Without async upload, Ultralytics resizes frames to imgsz itself."""
+    settings = _settings(
+        project_root,
+        model={"imgsz": 640, "async_upload": False},
+        camera={"inference_resolution": [1280, 720]},
+        inference_enabled=True,
+    )
+    assert settings.inference_resolution == (1280, 720)
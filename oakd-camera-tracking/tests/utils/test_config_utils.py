@@ -0,0 +1,106 @@
+"""Tests for YAML config loading and its in-process and on-disk caches."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+import yaml
+from src.utils import config_utils
+from src.utils.config_utils import load_yaml
+
+
+@pytest.fixture
+def yaml_parses(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    """Record the path of every YAML file actually parsed."""
+    parsed: list[str] = []
+    real_load = yaml.load
+
+    def counting_load(stream, Loader):  # noqa: N803
+        parsed.append(stream.name)
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(config_utils.yaml, "load", counting_load)
+    return parsed
+
+
+def _write(path: Path, text: str, mtime_ns: int | None = None) -> None:
+    """Write *text* to *path*, optionally setting its modification time."""
+    path.write_text(text)
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_returns_read_only_mapping(tmp_path: Path) -> None:
+    """Callers cannot change the cached config seen by later callers."""
+    path = tmp_path / "config.yaml"
+    _write(path, "conf: 0.7\n")
+    config = load_yaml(path)
+    assert config["conf"] == 0.7
+    with pytest.raises(TypeError):
+        config["conf"] = 0.1  # type: ignore[index]
+    assert load_yaml(path)["conf"] == 0.7
+
+
+def test_unchanged_file_is_parsed_once(tmp_path: Path, yaml_parses: list[str]) -> None:
+    """Repeat loads of an unchanged file come from the in-process cache."""
+    path = tmp_path / "config.yaml"
+    _write(path, "conf: 0.7\n")
+    load_yaml(path)
+    load_yaml(path)
+    assert len(yaml_parses) == 1
+
+
+def test_new_mtime_with_same_size_reparses(
+    tmp_path: Path, yaml_parses: list[str]
+) -> None:
+    """An edit that keeps the file size is still picked up via its mtime."""
+    path = tmp_path / "config.yaml"
+    _write(path, "conf: 0.7\n", mtime_ns=1_000_000_000)
+    assert load_yaml(path)["conf"] == 0.7
+    _write(path, "conf: 0.5\n", mtime_ns=2_000_000_000)
+    assert load_yaml(path)["conf"] == 0.5
+    assert len(yaml_parses) == 2
+
+
+def test_new_size_with_same_mtime_reparses(
+    tmp_path: Path, yaml_parses: list[str]
+) -> None:
+    """An edit that keeps the mtime (e.g. a copy) is picked up via its size."""
+    path = tmp_path / "config.yaml"
+    _write(path, "conf: 0.7\n", mtime_ns=1_000_000_000)
+    assert load_yaml(path)["conf"] == 0.7
+    _write(path, "conf: 0.25\n", mtime_ns=1_000_000_000)
+    assert load_yaml(path)["conf"] == 0.25
+    assert len(yaml_parses) == 2
+
+
+def test_json_sidecar_used_only_while_it_matches(
+    tmp_path: Path, yaml_parses: list[str]
+) -> None:
+    """The JSON sidecar replaces parsing on a cold start until the YAML changes."""
+    path = tmp_path / "config.yaml"
+    _write(path, "conf: 0.7\n", mtime_ns=1_000_000_000)
+    load_yaml(path)
+    assert (tmp_path / "config.yaml.json").exists()
+
+    # A fresh process has only the sidecar to go on.
+    config_utils._load_yaml_cached.cache_clear()
+    assert load_yaml(path)["conf"] == 0.7
+    assert len(yaml_parses) == 1
+
+    config_utils._load_yaml_cached.cache_clear()
+    _write(path, "conf: 0.5\n", mtime_ns=2_000_000_000)
+    assert load_yaml(path)["conf"] == 0.5
+    assert len(yaml_parses) == 2
+
+
+def test_missing_and_empty_files_raise(tmp_path: Path) -> None:
+    """Missing and empty config files are errors rather than empty configs."""
+    with pytest.raises(FileNotFoundError):
+        load_yaml(tmp_path / "missing.yaml")
+    empty = tmp_path / "empty.yaml"
+    _write(empty, "")
+    with pytest.raises(ValueError):
+        load_yaml(empty)
@@ -0,0 +1,69 @@
+"""Live viewer for frames the pipeline shares through shared memory.
+
+Run alongside ``run_pipeline.py`` with ``shared_memory_view: True`` set in
+``pipeline_config.yaml``. Press 'q' to close the viewer, which can be
+reopened at any time without affecting the pipeline, or 's' to stop the
+pipeline as well (the pipeline opens no window of its own to press 'q' in).
+
+Usage
+-----
+    python view_shared_frames.py
+    python view_shared_frames.py --camera CAM_A
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+import cv2
+from loguru import logger
+from src.camera.shared_frames import SharedFrameReader
+
+_QUIT_KEY: int = ord("q")
+_STOP_KEY: int = ord("s")
+# Milliseconds to wait for a key (and between polls for a new frame).
+_POLL_MS: int = 10
+
+
+def main() -> None:
+    """Parse arguments, attach to a camera's frames, and show them until 'q' or 's'."""
+    parser = argparse.ArgumentParser(description="OAK-D shared memory live viewer.")
+    parser.add_argument(
+        "--camera",
+        default="CAM_A",
+        help="Name of the colour camera to view",
+    )
+    args = parser.parse_args()
+
+    try:
+        reader = SharedFrameReader(args.camera)
+    except FileNotFoundError:
+        logger.error(
+            f"No frames shared for {args.camera}. Is the pipeline running with "
+            "'shared_memory_view: True'?"
+        )
+        sys.exit(1)
+
+    title = f"OAK-D Feed - {args.camera}"
+    try:
+        while True:
+            frame = reader.read()
+            if frame is not None:
+                cv2.imshow(title, frame)
+            key = cv2.waitKey(_POLL_MS) & 0xFF
+            if key == _STOP_KEY:
+                reader.request_stop()
+                logger.info("Asked the pipeline to stop.")
+                break
+            if key == _QUIT_KEY:
+                break
+    except KeyboardInterrupt:
+        pass
+    finally:
+        reader.close()
+        cv2.destroyAllWindows()
+
+
+if __name__ == "__main__":
+    main()